@@ -0,0 +1,50 @@
+"""
+Cold worker boot benchmark.
+
+Each run starts a fresh interpreter (as a new uvicorn worker would), imports
+main and runs the lifespan startup, and reports import, startup and total time.
+
+    python benchmarks/startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_CHILD = """
+import json, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app):
+    t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "startup": t2 - t1, "total": t2 - t0}))
+"""
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def main(runs: int) -> None:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD],
+            cwd=ROOT, env=os.environ.copy(), capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    print(f"{runs} cold boots")
+    for phase in ("import", "startup", "total"):
+        values = [s[phase] * 1000 for s in samples]
+        print(f"  {phase:<8} median {statistics.median(values):7.1f} ms   p95 {_percentile(values, 95):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -11,6 +11,67 @@ CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:3
 # Art Institute API response cache (seconds). 0 = disable.
 ARTIC_CACHE_TTL = int(os.getenv("ARTIC_CACHE_TTL", "3600"))
 
+# Circuit breaker for the Art Institute API: after N consecutive failures, fail fast
+# with 503 for COOLDOWN seconds. 0 = never open.
+ARTIC_BREAKER_THRESHOLD = int(os.getenv("ARTIC_BREAKER_THRESHOLD", "5"))
+ARTIC_BREAKER_COOLDOWN = float(os.getenv("ARTIC_BREAKER_COOLDOWN", "30"))
+
+# Pre-generated OpenAPI schema (JSON file) served instead of generating it at runtime.
+OPENAPI_SCHEMA_PATH = os.getenv("OPENAPI_SCHEMA_PATH", "").strip()
+
+# Artwork search result cache (seconds). 0 = disable.
+ARTIC_SEARCH_CACHE_TTL = int(os.getenv("ARTIC_SEARCH_CACHE_TTL", "300"))
+# Server-side search debounce window (seconds): a search superseded by the same client's
+# next keystroke within this window is answered from the newer search. 0 = disable.
+ARTIC_SEARCH_DEBOUNCE = float(os.getenv("ARTIC_SEARCH_DEBOUNCE", "0.2"))
+
+# Art Institute IIIF image server (used to build image URLs for stored artworks).
+ARTIC_IIIF_URL = os.getenv("ARTIC_IIIF_URL", "https://www.artic.edu/iiif/2")
+# Stored artwork metadata older than this (seconds) is re-pulled by the refresh job.
+ARTWORK_REFRESH_MAX_AGE = int(os.getenv("ARTWORK_REFRESH_MAX_AGE", str(7 * 24 * 3600)))
+
+# Write-behind title resolution. When enabled, places are stored immediately with a
+# pending title and a background worker fills titles in (batched, with retries).
+ARTIC_ASYNC_TITLES = os.getenv("ARTIC_ASYNC_TITLES", "").strip().lower() in ("1", "true", "yes")
+TITLE_RESOLVER_BATCH_SIZE = int(os.getenv("TITLE_RESOLVER_BATCH_SIZE", "20"))
+TITLE_RESOLVER_MAX_RETRIES = int(os.getenv("TITLE_RESOLVER_MAX_RETRIES", "3"))
+TITLE_RESOLVER_RETRY_BACKOFF = float(os.getenv("TITLE_RESOLVER_RETRY_BACKOFF", "0.5"))
+# Pending places claimed by a process longer ago than this (seconds) are taken over
+# by another one (the owner is assumed dead); workers sweep for them this often.
+TITLE_CLAIM_TIMEOUT = int(os.getenv("TITLE_CLAIM_TIMEOUT", "300"))
+
+# Idempotency-Key support on create endpoints: how long stored responses are replayed
+# (seconds) and how many are kept in memory (all are also persisted in the database).
+IDEMPOTENCY_TTL = int(os.getenv("IDEMPOTENCY_TTL", "86400"))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+# How long a key stays claimed by a request that is still running (seconds); after
+# that (e.g. the worker died) another request may take it over.
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT", "60"))
+
+# Change feed (SSE): events kept for Last-Event-ID resume, and keep-alive interval (seconds).
+EVENT_LOG_SIZE = int(os.getenv("EVENT_LOG_SIZE", "1000"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Archival of finished projects: completed projects not updated for ARCHIVE_AFTER_DAYS
+# are moved to archive tables in batches (with a pause between batches).
+# ARCHIVE_INTERVAL (seconds) runs the job in-process periodically; 0 = only via CLI.
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "200"))
+ARCHIVE_BATCH_PAUSE = float(os.getenv("ARCHIVE_BATCH_PAUSE", "0.1"))
+ARCHIVE_INTERVAL = int(os.getenv("ARCHIVE_INTERVAL", "0"))
+
+# Admission control. Per-client token bucket (requests/second, burst); 0 = no rate limit.
+RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "20"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "40"))
+# Global concurrency cap with a bounded wait queue; beyond it requests get 503 + Retry-After.
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "32"))
+MAX_QUEUED_REQUESTS = int(os.getenv("MAX_QUEUED_REQUESTS", "64"))
+QUEUE_TIMEOUT = float(os.getenv("QUEUE_TIMEOUT", "2"))
+# Separate, smaller budget for write endpoints that call the Art Institute API.
+ARTIC_WRITE_MAX_CONCURRENT = int(os.getenv("ARTIC_WRITE_MAX_CONCURRENT", "8"))
+ARTIC_WRITE_MAX_QUEUED = int(os.getenv("ARTIC_WRITE_MAX_QUEUED", "16"))
+SHED_RETRY_AFTER = int(os.getenv("SHED_RETRY_AFTER", "1"))
+
 # Basic auth (optional). If both set, all project/place endpoints require auth.
 BASIC_AUTH_USER = os.getenv("BASIC_AUTH_USER", "").strip()
 BASIC_AUTH_PASSWORD = os.getenv("BASIC_AUTH_PASSWORD", "").strip()
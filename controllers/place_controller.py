@@ -6,11 +6,12 @@ from typing import List
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
-from config import MAX_PLACES_PER_PROJECT
+from config import ARTIC_ASYNC_TITLES, MAX_PLACES_PER_PROJECT
 from models import Project, ProjectPlace
+from models.project_place import TITLE_STATUS_INVALID, TITLE_STATUS_PENDING, TITLE_STATUS_RESOLVED
 from schemas import PlaceCreate, PlaceListOut, PlaceOut, PlaceUpdate, place_to_out
 from schemas.project import _places_sorted_newest_first
-from services import fetch_artwork_title
+from services import analytics, ensure_artworks, event_bus, title_resolver
 
 
 def list_places(
@@ -59,17 +60,26 @@ async def add_place(project_id: int, payload: PlaceCreate, db: Session) -> Place
             detail="This place is already added to the project",
         )
 
-    title = await fetch_artwork_title(external_id_str)
+    if ARTIC_ASYNC_TITLES:
+        title, title_status = None, TITLE_STATUS_PENDING
+    else:
+        artworks = await ensure_artworks(db, [external_id_str])
+        title, title_status = artworks[external_id_str].title, TITLE_STATUS_RESOLVED
     place = ProjectPlace(
         project_id=project_id,
         external_id=external_id_str,
         title=title,
+        title_status=title_status,
         notes=payload.notes,
         visited=False,
     )
     db.add(place)
+    analytics.record_place_added(db, project_id, external_id_str)
     db.commit()
     db.refresh(place)
+    if title_status == TITLE_STATUS_PENDING:
+        title_resolver.enqueue([place.id])
+    event_bus.publish("place.created", project_id, place_id=place.id)
     return place_to_out(place)
 
 
@@ -101,9 +111,17 @@ def update_place(project_id: int, place_id: int, payload: PlaceUpdate, db: Sessi
 
     if payload.notes is not None:
         place.notes = payload.notes.strip() or None
-    if payload.visited is not None:
+    if payload.visited is not None and payload.visited != place.visited:
         place.visited = payload.visited
+        analytics.record_visited_changed(
+            db,
+            project_id,
+            place.external_id,
+            payload.visited,
+            count_artwork=place.title_status != TITLE_STATUS_INVALID,
+        )
 
     db.commit()
     db.refresh(place)
+    event_bus.publish("place.updated", project_id, place_id=place.id)
     return place_to_out(place)
\ No newline at end of file
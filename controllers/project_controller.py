@@ -1,24 +1,28 @@
 """
 Project API controller (business logic for project endpoints).
 """
+from datetime import datetime
 from typing import List
 
 from fastapi import HTTPException, status
-from sqlalchemy import Integer, func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, delete, func, or_, select
+from sqlalchemy.orm import Session, joinedload
 
-from config import MAX_PLACES_PER_PROJECT
+from config import ARTIC_ASYNC_TITLES, MAX_PLACES_PER_PROJECT
 from models import Project, ProjectPlace
+from models.project_place import TITLE_STATUS_PENDING, TITLE_STATUS_RESOLVED
 from schemas import (
+    ProjectBulkDeleteOut,
     ProjectCreate,
     ProjectDetailOut,
     ProjectListOut,
     ProjectOut,
     ProjectUpdate,
+    place_to_out,
     project_to_detail_out,
     project_to_out,
 )
-from services import fetch_artwork_title
+from services import analytics, archive, ensure_artworks, event_bus, title_resolver
 
 
 async def create_project(payload: ProjectCreate, db: Session) -> ProjectOut:
@@ -36,8 +40,10 @@ async def create_project(payload: ProjectCreate, db: Session) -> ProjectOut:
             unique_ids.append(eid)
 
     id_to_title: dict[str, str | None] = {}
-    for eid in unique_ids:
-        id_to_title[eid] = await fetch_artwork_title(eid)
+    if not ARTIC_ASYNC_TITLES:
+        artworks = await ensure_artworks(db, unique_ids)
+        id_to_title = {eid: artwork.title for eid, artwork in artworks.items()}
+    title_status = TITLE_STATUS_PENDING if ARTIC_ASYNC_TITLES else TITLE_STATUS_RESOLVED
 
     project = Project(
         name=payload.name.strip(),
@@ -53,23 +59,104 @@ async def create_project(payload: ProjectCreate, db: Session) -> ProjectOut:
                 project_id=project.id,
                 external_id=eid,
                 title=id_to_title.get(eid),
+                title_status=title_status,
                 visited=False,
             )
         )
 
+    analytics.record_project_created(db, project.id, unique_ids)
     db.commit()
     db.refresh(project)
+    if title_status == TITLE_STATUS_PENDING:
+        title_resolver.enqueue([p.id for p in project.places])
+    event_bus.publish("project.created", project.id)
     return project_to_out(project)
 
 
-def list_projects(
-    db: Session,
-    skip: int = 0,
-    limit: int = 20,
-    search: str | None = None,
-    completed: bool | None = None,
-) -> ProjectListOut:
-    q = db.query(Project).order_by(Project.id.desc())
+# Fields accepted by `fields=`; "id" is always returned.
+PROJECT_FIELDS = ("id", "name", "description", "start_date", "places_count", "completed", "places")
+_COLUMN_FIELDS = ("name", "description", "start_date")
+MAX_MULTI_GET_IDS = 100
+
+
+def _parse_fields(fields: str | None) -> set[str] | None:
+    """Parse `fields=a,b,c` (None = full representation)."""
+    if fields is None:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(PROJECT_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return requested | {"id"}
+
+
+def _parse_ids(ids: str | None) -> list[int] | None:
+    """Parse `ids=1,2,3` for multi-get (None = no ID filter)."""
+    if ids is None:
+        return None
+    try:
+        parsed = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers",
+        )
+    if len(parsed) > MAX_MULTI_GET_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Maximum {MAX_MULTI_GET_IDS} ids per request",
+        )
+    return parsed
+
+
+def _sparse_query(db: Session, fields: set[str]):
+    """Query only the columns (and place aggregates) needed for fields; never loads places."""
+    q = db.query(Project.id, *(getattr(Project, f) for f in _COLUMN_FIELDS if f in fields))
+    if fields & {"places_count", "completed"}:
+        places_count = (
+            select(func.count(ProjectPlace.id))
+            .where(ProjectPlace.project_id == Project.id)
+            .scalar_subquery()
+        )
+        visited_count = (
+            select(func.count(ProjectPlace.id))
+            .where(ProjectPlace.project_id == Project.id, ProjectPlace.visited.is_(True))
+            .scalar_subquery()
+        )
+        q = q.add_columns(places_count.label("places_count"), visited_count.label("visited_count"))
+    return q
+
+
+def _sparse_row(row, fields: set[str]) -> dict:
+    item = {f: getattr(row, f) for f in ("id", *_COLUMN_FIELDS) if f in fields}
+    if "places_count" in fields:
+        item["places_count"] = row.places_count
+    if "completed" in fields:
+        item["completed"] = row.places_count > 0 and row.visited_count == row.places_count
+    return item
+
+
+def _attach_places(db: Session, items: list[dict]) -> None:
+    """Load places (with stored artworks) for all items in one query."""
+    by_project: dict[int, list] = {item["id"]: [] for item in items}
+    if by_project:
+        places = (
+            db.query(ProjectPlace)
+            .options(joinedload(ProjectPlace.artwork))
+            .filter(ProjectPlace.project_id.in_(list(by_project)))
+            .order_by(ProjectPlace.id.desc())
+            .all()
+        )
+        for place in places:
+            by_project[place.project_id].append(place_to_out(place, include_artwork=True))
+    for item in items:
+        item["places"] = by_project[item["id"]]
+
+
+def _apply_filters(q, db: Session, search: str | None, completed: bool | None):
     if search and search.strip():
         term = f"%{search.strip()}%"
         q = q.filter(
@@ -93,16 +180,76 @@ def list_projects(
         else:
             # Not completed: no places or at least one place not visited
             q = q.filter(~Project.id.in_(select(completed_sub.c.project_id)))
-    total = q.count()
-    projects = q.offset(skip).limit(limit).all()
-    return ProjectListOut(items=[project_to_out(p) for p in projects], total=total)
+    return q
 
 
-def get_project(project_id: int, db: Session) -> ProjectDetailOut:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+def list_projects(
+    db: Session,
+    skip: int = 0,
+    limit: int = 20,
+    search: str | None = None,
+    completed: bool | None = None,
+    ids: str | None = None,
+    fields: str | None = None,
+) -> ProjectListOut | dict:
+    """
+    List projects. With `ids`, returns exactly those projects (in the given order,
+    ignoring skip/limit). With `fields`, returns plain dicts holding only those
+    fields, and only the needed columns are queried.
+    """
+    field_set = _parse_fields(fields)
+    id_list = _parse_ids(ids)
+    q = db.query(Project) if field_set is None else _sparse_query(db, field_set)
+    q = _apply_filters(q, db, search, completed).order_by(Project.id.desc())
+    if id_list is not None:
+        rows = q.filter(Project.id.in_(id_list)).all()
+        position = {pid: i for i, pid in enumerate(id_list)}
+        rows.sort(key=lambda r: position[r.id])
+        total = len(rows)
+    else:
+        total = q.with_entities(Project.id).count()
+        rows = q.offset(skip).limit(limit).all()
+
+    if field_set is None:
+        return ProjectListOut(items=[project_to_out(p) for p in rows], total=total)
+    items = [_sparse_row(r, field_set) for r in rows]
+    if "places" in field_set:
+        _attach_places(db, items)
+    return {"items": items, "total": total}
+
+
+def _get_archived_project(project_id: int, db: Session) -> ProjectDetailOut:
+    """Fallback for projects moved to the archive tables."""
+    archived = archive.get_archived_project(db, project_id)
+    if archived is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project_to_detail_out(project)
+    out = project_to_detail_out(archived, include_artworks=True)
+    out.archived = True
+    return out
+
+
+def get_project(project_id: int, db: Session, fields: str | None = None) -> ProjectDetailOut | dict:
+    field_set = _parse_fields(fields)
+    if field_set is not None:
+        row = _sparse_query(db, field_set).filter(Project.id == project_id).first()
+        if not row:
+            archived = _get_archived_project(project_id, db).model_dump()
+            return {k: v for k, v in archived.items() if k in field_set or k == "archived"}
+        item = _sparse_row(row, field_set)
+        if "places" in field_set:
+            _attach_places(db, [item])
+        return item
+
+    # Places and their stored artwork metadata come back in the same joined query.
+    project = (
+        db.query(Project)
+        .options(joinedload(Project.places).joinedload(ProjectPlace.artwork))
+        .filter(Project.id == project_id)
+        .first()
+    )
+    if not project:
+        return _get_archived_project(project_id, db)
+    return project_to_detail_out(project, include_artworks=True)
 
 
 def update_project(project_id: int, payload: ProjectUpdate, db: Session) -> ProjectOut:
@@ -119,25 +266,71 @@ def update_project(project_id: int, payload: ProjectUpdate, db: Session) -> Proj
 
     db.commit()
     db.refresh(project)
+    event_bus.publish("project.updated", project.id)
     return project_to_out(project)
 
 
-def delete_project(project_id: int, db: Session) -> None:
+def restore_project(project_id: int, db: Session) -> ProjectOut:
+    archive.restore_project(db, project_id)
     project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    return project_to_out(project)
 
-    any_visited = (
-        db.query(ProjectPlace)
-        .filter(ProjectPlace.project_id == project_id, ProjectPlace.visited.is_(True))
-        .first()
-        is not None
+
+def _no_visited_places():
+    """Condition: the project (in the enclosing statement) has no visited places."""
+    return ~(
+        select(ProjectPlace.id)
+        .where(ProjectPlace.project_id == Project.id, ProjectPlace.visited.is_(True))
+        .exists()
+    )
+
+
+def delete_project(project_id: int, db: Session) -> None:
+    # One statement checks the "no visited places" rule and deletes; places go via ON DELETE CASCADE.
+    deletable = select(Project.id).where(Project.id == project_id, _no_visited_places())
+    analytics.record_projects_deleting(db, deletable)
+    result = db.execute(delete(Project).where(Project.id == project_id, _no_visited_places()))
+    db.commit()
+    if result.rowcount:
+        event_bus.publish("project.deleted", project_id)
+        return
+
+    if db.query(Project.id).filter(Project.id == project_id).first() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cannot delete project with visited places",
     )
-    if any_visited:
+
+
+def bulk_delete_projects(
+    db: Session,
+    search: str | None = None,
+    completed: bool | None = None,
+    ids: str | None = None,
+    updated_before: datetime | None = None,
+) -> ProjectBulkDeleteOut:
+    """
+    Delete every project matching the filters in a single statement.
+    Projects with visited places are skipped. At least one filter is required.
+    """
+    id_list = _parse_ids(ids)
+    if not ((search and search.strip()) or completed is not None or id_list is not None or updated_before):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete project with visited places",
+            detail="At least one filter is required for bulk delete",
         )
+    matching = _apply_filters(db.query(Project.id), db, search, completed)
+    if id_list is not None:
+        matching = matching.filter(Project.id.in_(id_list))
+    if updated_before is not None:
+        matching = matching.filter(*archive.inactive_since(updated_before))
 
-    db.delete(project)
+    condition = (Project.id.in_(matching.subquery().select()), _no_visited_places())
+    analytics.record_projects_deleting(db, select(Project.id).where(*condition))
+    stmt = delete(Project).where(*condition).returning(Project.id)
+    deleted_ids = db.execute(stmt, execution_options={"synchronize_session": False}).scalars().all()
     db.commit()
+    for pid in deleted_ids:
+        event_bus.publish("project.deleted", pid)
+    return ProjectBulkDeleteOut(deleted=len(deleted_ids))
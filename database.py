@@ -1,8 +1,9 @@
 """
 Database engine, session, and lifecycle.
 """
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from config import DATABASE_URL
 from models import Base
@@ -11,6 +12,15 @@ engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@event.listens_for(engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite ignores ON DELETE CASCADE unless foreign keys are enabled per connection."""
+    if engine.dialect.name == "sqlite":
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 def get_db():
     """Dependency that yields a DB session."""
     db = SessionLocal()
@@ -20,12 +30,96 @@ def get_db():
         db.close()
 
 
+# (table, column, ALTER statement) for columns added after the table was first created.
+_MIGRATIONS = [
+    ("project_places", "title", "ALTER TABLE project_places ADD COLUMN title VARCHAR(500)"),
+    (
+        "project_places",
+        "title_status",
+        "ALTER TABLE project_places ADD COLUMN title_status VARCHAR(20) NOT NULL DEFAULT 'resolved'",
+    ),
+    ("project_places", "title_claimed_at", "ALTER TABLE project_places ADD COLUMN title_claimed_at DATETIME"),
+]
+
+
+# Tables whose IDs must never be reused, with the archive table that may hold
+# IDs beyond their current max(id) (see services.archive).
+_AUTOINCREMENT_TABLES = [("projects", "archived_projects"), ("project_places", "archived_project_places")]
+
+
+def _migrate_autoincrement():
+    """
+    Rebuild tables created before AUTOINCREMENT was enabled (SQLite cannot ALTER
+    it in), and start their ID sequence past any ID kept in the archive.
+    """
+    with engine.connect() as conn:
+        pending = [
+            (table, archive)
+            for table, archive in _AUTOINCREMENT_TABLES
+            if "AUTOINCREMENT" not in conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table}
+            ).scalar_one().upper()
+        ]
+    if not pending:
+        return
+    raw = engine.raw_connection()
+    try:
+        sqlite = raw.driver_connection
+        isolation_level = sqlite.isolation_level
+        sqlite.isolation_level = None
+        # Table rebuild procedure from https://www.sqlite.org/lang_altertable.html
+        sqlite.execute("PRAGMA foreign_keys=OFF")
+        try:
+            sqlite.execute("BEGIN")
+            for name, archive in pending:
+                table = Base.metadata.tables[name]
+                columns = ", ".join(row[1] for row in sqlite.execute(f"PRAGMA table_info({name})"))
+                ddl = str(CreateTable(table).compile(dialect=engine.dialect)).strip()
+                sqlite.execute(ddl.replace(f"CREATE TABLE {name} ", f"CREATE TABLE _new_{name} ", 1))
+                sqlite.execute(f"INSERT INTO _new_{name} ({columns}) SELECT {columns} FROM {name}")
+                sqlite.execute(f"DROP TABLE {name}")
+                sqlite.execute(f"ALTER TABLE _new_{name} RENAME TO {name}")
+                for index in table.indexes:
+                    sqlite.execute(str(CreateIndex(index).compile(dialect=engine.dialect)))
+                sqlite.execute("DELETE FROM sqlite_sequence WHERE name = ?", (name,))
+                sqlite.execute(
+                    f"INSERT INTO sqlite_sequence (name, seq) SELECT ?, max("
+                    f"(SELECT coalesce(max(id), 0) FROM {name}), (SELECT coalesce(max(id), 0) FROM {archive}))",
+                    (name,),
+                )
+            sqlite.execute("COMMIT")
+        except Exception:
+            sqlite.execute("ROLLBACK")
+            raise
+        finally:
+            sqlite.execute("PRAGMA foreign_keys=ON")
+            sqlite.isolation_level = isolation_level
+    finally:
+        raw.close()
+
+
 def init_db():
     """Create tables and run migrations (e.g. add optional columns)."""
     Base.metadata.create_all(bind=engine)
-    try:
+    inspector = inspect(engine)
+    columns: dict[str, set[str]] = {}
+    for table, column, statement in _MIGRATIONS:
+        if table not in columns:
+            columns[table] = {c["name"] for c in inspector.get_columns(table)}
+        if column in columns[table]:
+            continue
         with engine.connect() as conn:
-            conn.execute(text("ALTER TABLE project_places ADD COLUMN title VARCHAR(500)"))
+            conn.execute(text(statement))
             conn.commit()
-    except Exception:
-        pass
+    if engine.dialect.name == "sqlite":
+        _migrate_autoincrement()
+
+    # Seed analytics aggregates from existing data the first time.
+    from services import analytics
+
+    db = SessionLocal()
+    try:
+        if not analytics.is_initialized(db):
+            analytics.rebuild(db)
+    finally:
+        db.close()
@@ -1,17 +1,59 @@
 """
 Travel Planner API entry point.
+
+Importing this module only builds the app object (no database access), so tools
+that just need the app (OpenAPI export, tests) stay fast. Schema creation,
+migrations and background jobs run in the lifespan handler at server startup.
 """
+import time
+
+_import_started = time.perf_counter()
+
+import json
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import get_openapi
+
+from config import ARCHIVE_INTERVAL, ARTIC_ASYNC_TITLES, CORS_ORIGINS, OPENAPI_SCHEMA_PATH
+from middleware import AdmissionControlMiddleware
+from routes import artworks, events, health, metrics, places, projects, stats
+from services.health import startup_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    from database import init_db
+
+    init_db()
+    startup_stats["init_db_seconds"] = round(time.perf_counter() - started, 4)
+    if ARTIC_ASYNC_TITLES:
+        from database import SessionLocal
+        from services.title_worker import requeue_pending_titles
 
-from config import CORS_ORIGINS
-from database import init_db
-from routes import places, projects
+        db = SessionLocal()
+        try:
+            requeue_pending_titles(db)
+        finally:
+            db.close()
+    if ARCHIVE_INTERVAL > 0:
+        from services.archive import start_periodic_archiver
 
-init_db()
+        start_periodic_archiver(ARCHIVE_INTERVAL)
+    startup_stats["startup_seconds"] = round(time.perf_counter() - started, 4)
+    startup_stats["started"] = True
+    yield
+    startup_stats["started"] = False
 
-app = FastAPI(title="Travel Planner API")
 
+app = FastAPI(title="Travel Planner API", lifespan=lifespan)
+
+# Added before CORS so CORS stays outermost and 429/503 responses carry CORS headers.
+app.add_middleware(AdmissionControlMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
@@ -22,8 +64,43 @@ app.add_middleware(
 
 app.include_router(projects.router)
 app.include_router(places.router)
+app.include_router(artworks.router)
+app.include_router(events.router)
+app.include_router(stats.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
 
 
-@app.get("/", summary="Health check")
-def read_root():
+@app.get("/", summary="Health check (liveness)")
+async def read_root():
     return {"message": "Travel Planner API is running"}
+
+
+def _openapi() -> dict:
+    """Serve the pre-generated schema from OPENAPI_SCHEMA_PATH if present; else generate once."""
+    if app.openapi_schema is None:
+        path = Path(OPENAPI_SCHEMA_PATH) if OPENAPI_SCHEMA_PATH else None
+        if path is not None and path.is_file():
+            app.openapi_schema = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            app.openapi_schema = get_openapi(
+                title=app.title, version=app.version, routes=app.routes
+            )
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+startup_stats["import_seconds"] = round(time.perf_counter() - _import_started, 4)
+
+
+if __name__ == "__main__":
+    # python main.py export-openapi [path]  -> write the schema for OPENAPI_SCHEMA_PATH
+    if len(sys.argv) >= 2 and sys.argv[1] == "export-openapi":
+        target = Path(sys.argv[2] if len(sys.argv) > 2 else "openapi.json")
+        schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+        target.write_text(json.dumps(schema), encoding="utf-8")
+        print(f"Wrote {target}")
+    else:
+        print("usage: python main.py export-openapi [path]")
+        sys.exit(2)
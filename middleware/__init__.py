@@ -0,0 +1,6 @@
+"""
+ASGI middleware.
+"""
+from middleware.admission import AdmissionControlMiddleware, admission
+
+__all__ = ["AdmissionControlMiddleware", "admission"]
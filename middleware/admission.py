@@ -0,0 +1,194 @@
+"""
+Admission control: per-client rate limiting, concurrency caps and load shedding.
+
+Each client gets a token bucket (429 when empty). Admitted requests then take a
+slot in a concurrency pool; when all slots are busy they wait in a bounded queue,
+and are shed with 503 + Retry-After when the queue is full or the wait times out.
+Write endpoints that call the Art Institute API use their own, smaller pool so
+they cannot starve cheap reads. Health checks and metrics are never limited;
+SSE change feeds are rate limited on connect only.
+"""
+import asyncio
+import math
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config import (
+    ARTIC_WRITE_MAX_CONCURRENT,
+    ARTIC_WRITE_MAX_QUEUED,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_QUEUED_REQUESTS,
+    QUEUE_TIMEOUT,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+    SHED_RETRY_AFTER,
+)
+
+EXEMPT_PATHS = {"/", "/health/live", "/health/ready", "/metrics"}
+_ARTIC_WRITE_PATH = re.compile(r"^/projects(/\d+/places)?/?$")
+# Long-lived SSE streams are rate limited on connect but hold no concurrency slot.
+_STREAM_PATH = re.compile(r"^(/projects/\d+)?/events$")
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets; keeps at most max_keys buckets (least recently used dropped)."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 10_000):
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._rate > 0
+
+    def acquire(self, key: str) -> float:
+        """Take a token for key. Returns 0 if allowed, else seconds until a token is available."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (float(self._burst), now))
+            tokens = min(self._burst, tokens + (now - updated) * self._rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self._rate
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+
+class ConcurrencyPool:
+    """Concurrency cap with a bounded FIFO wait queue (max_concurrent <= 0 = unlimited)."""
+
+    def __init__(self, max_concurrent: int, max_queued: int, queue_timeout: float):
+        self._max_concurrent = max_concurrent
+        self._max_queued = max(0, max_queued)
+        self._queue_timeout = queue_timeout
+        self._active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self.queued_total = 0
+        self.shed_total = 0
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed. Returns False if shed."""
+        if self._max_concurrent <= 0 or (self._active < self._max_concurrent and not self._waiters):
+            self._active += 1
+            return True
+        if len(self._waiters) >= self._max_queued:
+            self.shed_total += 1
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued_total += 1
+        try:
+            # release() hands its slot over by resolving the future (active count unchanged).
+            await asyncio.wait_for(waiter, self._queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.shed_total += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "active": self._active,
+            "waiting": len(self._waiters),
+            "queued_total": self.queued_total,
+            "shed_total": self.shed_total,
+        }
+
+
+class AdmissionController:
+    """Shared admission state (one per process), also read by GET /metrics."""
+
+    def __init__(self):
+        self.limiter = TokenBucketLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        self.default_pool = ConcurrencyPool(MAX_CONCURRENT_REQUESTS, MAX_QUEUED_REQUESTS, QUEUE_TIMEOUT)
+        self.artic_write_pool = ConcurrencyPool(ARTIC_WRITE_MAX_CONCURRENT, ARTIC_WRITE_MAX_QUEUED, QUEUE_TIMEOUT)
+        self.rate_limited_total = 0
+
+    def pool_for(self, scope: Scope) -> ConcurrencyPool:
+        if scope["method"] == "POST" and _ARTIC_WRITE_PATH.match(scope["path"]):
+            return self.artic_write_pool
+        return self.default_pool
+
+    def stats(self) -> dict:
+        return {
+            "rate_limited_total": self.rate_limited_total,
+            "default": self.default_pool.stats(),
+            "artic_writes": self.artic_write_pool.stats(),
+        }
+
+
+admission = AdmissionController()
+
+
+def _client_key(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class AdmissionControlMiddleware:
+    """Pure ASGI middleware applying the shared AdmissionController."""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController = admission):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if self.controller.limiter.enabled:
+            wait = self.controller.limiter.acquire(_client_key(scope))
+            if wait > 0:
+                self.controller.rate_limited_total += 1
+                response = JSONResponse(
+                    {"detail": "Too many requests"},
+                    status_code=429,
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+                await response(scope, receive, send)
+                return
+
+        if _STREAM_PATH.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        pool = self.controller.pool_for(scope)
+        if not await pool.acquire():
+            response = JSONResponse(
+                {"detail": "Server is busy, try again later"},
+                status_code=503,
+                headers={"Retry-After": str(SHED_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            pool.release()
@@ -1,8 +1,23 @@
 """
 SQLAlchemy models.
 """
+from models.archive import ArchivedProject, ArchivedProjectPlace
+from models.artwork import Artwork
 from models.base import Base
+from models.idempotency_key import IdempotencyKey
 from models.project import Project
 from models.project_place import ProjectPlace
+from models.stats import ArtworkStats, ProjectStats, StatsCounter
 
-__all__ = ["Base", "Project", "ProjectPlace"]
+__all__ = [
+    "ArchivedProject",
+    "ArchivedProjectPlace",
+    "Artwork",
+    "ArtworkStats",
+    "Base",
+    "IdempotencyKey",
+    "Project",
+    "ProjectPlace",
+    "ProjectStats",
+    "StatsCounter",
+]
@@ -0,0 +1,52 @@
+"""
+Archive SQLAlchemy models (cold copies of finished projects, see services.archive).
+"""
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import relationship
+
+from models.base import Base
+
+
+class ArchivedProject(Base):
+    __tablename__ = "archived_projects"
+
+    # Same ID as the project had in the projects table.
+    id = Column(Integer, primary_key=True)
+    name = Column(String(200), nullable=False)
+    description = Column(String(1000), nullable=True)
+    start_date = Column(Date, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    places = relationship(
+        "ArchivedProjectPlace",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+
+
+class ArchivedProjectPlace(Base):
+    __tablename__ = "archived_project_places"
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(
+        Integer, ForeignKey("archived_projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    external_id = Column(String(50), nullable=False)
+    title = Column(String(500), nullable=True)
+    title_status = Column(String(20), nullable=False)
+    notes = Column(String(2000), nullable=True)
+    visited = Column(Boolean, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+    project = relationship("ArchivedProject", back_populates="places")
+    artwork = relationship(
+        "Artwork",
+        primaryjoin="foreign(ArchivedProjectPlace.external_id) == Artwork.external_id",
+        viewonly=True,
+        uselist=False,
+    )
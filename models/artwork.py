@@ -0,0 +1,23 @@
+"""
+Artwork SQLAlchemy model (local copy of Art Institute metadata, shared by all projects).
+"""
+from sqlalchemy import Column, DateTime, Integer, String, func
+
+from models.base import Base
+
+
+class Artwork(Base):
+    __tablename__ = "artworks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    external_id = Column(String(50), nullable=False, unique=True, index=True)
+    title = Column(String(500), nullable=True)
+    artist_display = Column(String(1000), nullable=True)
+    date_display = Column(String(200), nullable=True)
+    image_id = Column(String(100), nullable=True)
+    gallery_title = Column(String(500), nullable=True)
+    fetched_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
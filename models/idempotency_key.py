@@ -0,0 +1,19 @@
+"""
+IdempotencyKey SQLAlchemy model (stored responses for Idempotency-Key replays).
+"""
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from models.base import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    # "<scope>:<client key>", e.g. "POST /projects:3f1c..."
+    key = Column(String(400), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=False)
+    response_body = Column(Text, nullable=False)
+    # Naive UTC.
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
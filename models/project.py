@@ -9,6 +9,8 @@ from models.base import Base
 
 class Project(Base):
     __tablename__ = "projects"
+    # Never reuse IDs: archived projects keep theirs (see services.archive).
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False)
@@ -23,5 +25,7 @@ class Project(Base):
         "ProjectPlace",
         back_populates="project",
         cascade="all, delete-orphan",
+        # Rows are removed by ON DELETE CASCADE in the database, not one by one.
+        passive_deletes=True,
         lazy="joined",
     )
@@ -1,11 +1,19 @@
 """
 ProjectPlace SQLAlchemy model.
 """
+from datetime import datetime, timezone
+
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 
 from models.base import Base
 
+# Title resolution states (see services.title_worker).
+TITLE_STATUS_RESOLVED = "resolved"
+TITLE_STATUS_PENDING = "pending"
+TITLE_STATUS_INVALID = "invalid"
+TITLE_STATUS_FAILED = "failed"
+
 
 class ProjectPlace(Base):
     __tablename__ = "project_places"
@@ -16,6 +24,14 @@ class ProjectPlace(Base):
     )
     external_id = Column(String(50), nullable=False)
     title = Column(String(500), nullable=True)
+    title_status = Column(
+        String(20),
+        nullable=False,
+        default=TITLE_STATUS_RESOLVED,
+        server_default=TITLE_STATUS_RESOLVED,
+    )
+    # When a process last took this place's title resolution (see services.title_worker).
+    title_claimed_at = Column(DateTime(timezone=True), nullable=True, default=lambda: datetime.now(timezone.utc))
     notes = Column(String(2000), nullable=True)
     visited = Column(Boolean, nullable=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -24,6 +40,12 @@ class ProjectPlace(Base):
     )
 
     project = relationship("Project", back_populates="places")
+    artwork = relationship(
+        "Artwork",
+        primaryjoin="foreign(ProjectPlace.external_id) == Artwork.external_id",
+        viewonly=True,
+        uselist=False,
+    )
 
     __table_args__ = (
         UniqueConstraint(
@@ -31,4 +53,6 @@ class ProjectPlace(Base):
             "external_id",
             name="uq_project_place_external_per_project",
         ),
+        # Never reuse IDs: archived places keep theirs (see services.archive).
+        {"sqlite_autoincrement": True},
     )
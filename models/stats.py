@@ -0,0 +1,32 @@
+"""
+Analytics aggregate tables (maintained incrementally by services.analytics).
+"""
+from sqlalchemy import Column, Integer, String
+
+from models.base import Base
+
+
+class StatsCounter(Base):
+    """Named global counter, e.g. "projects" or "places_per_project:3"."""
+    __tablename__ = "stats_counters"
+
+    name = Column(String(100), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class ProjectStats(Base):
+    """Per-project place counts (needed to detect completed / histogram transitions)."""
+    __tablename__ = "project_stats"
+
+    project_id = Column(Integer, primary_key=True)
+    places_count = Column(Integer, nullable=False, default=0)
+    visited_count = Column(Integer, nullable=False, default=0)
+
+
+class ArtworkStats(Base):
+    """How often an artwork was added to projects, and visited."""
+    __tablename__ = "artwork_stats"
+
+    external_id = Column(String(50), primary_key=True)
+    added_count = Column(Integer, nullable=False, default=0, index=True)
+    visited_count = Column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 """
 API route modules.
 """
-from . import places, projects
+from . import artworks, events, health, metrics, places, projects, stats
 
-__all__ = ["places", "projects"]
+__all__ = ["artworks", "events", "health", "metrics", "places", "projects", "stats"]
@@ -0,0 +1,31 @@
+"""
+Artwork search routes (place picker).
+"""
+from fastapi import APIRouter, Depends, Query, Request
+
+from auth import verify_basic_auth
+from schemas import ArtworkSearchOut, artwork_record_to_out
+from services import artwork_search
+
+router = APIRouter(prefix="/artworks", tags=["artworks"])
+
+
+@router.get(
+    "/search",
+    response_model=ArtworkSearchOut,
+    summary="Search Art Institute artworks (cached, debounced)",
+)
+async def search_artworks(
+    request: Request,
+    _: None = Depends(verify_basic_auth),
+    q: str = Query(..., min_length=1, max_length=200),
+    page: int = Query(1, ge=1, le=100),
+    limit: int = Query(20, ge=1, le=100),
+):
+    client = request.client.host if request.client else None
+    result = await artwork_search.search(q, page=page, limit=limit, client=client)
+    return ArtworkSearchOut(
+        query=result["query"],
+        items=[artwork_record_to_out(item) for item in result["items"]],
+        total=result["total"],
+    )
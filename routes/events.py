@@ -0,0 +1,69 @@
+"""
+Change feed routes (Server-Sent Events).
+"""
+import json
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+
+from auth import verify_basic_auth
+from config import SSE_HEARTBEAT_SECONDS
+from services import event_bus
+
+router = APIRouter(tags=["events"])
+
+
+def _format(event) -> str:
+    data = json.dumps({"project_id": event.project_id, **event.data}, separators=(",", ":"))
+    return f"id: {event.id}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+async def _stream(request: Request, last_event_id: int | None, project_id: int | None):
+    event_bus.subscribers += 1
+    try:
+        cursor = event_bus.last_id if last_event_id is None else last_event_id
+        # Tell EventSource to wait a few seconds before reconnecting.
+        yield "retry: 3000\n\n"
+        while True:
+            events, missed, head = event_bus.since(cursor, project_id)
+            if missed:
+                # Events were dropped from the log; the client should refetch.
+                yield f"id: {head}\nevent: reset\ndata: {{}}\n\n"
+            for event in events:
+                yield _format(event)
+            if not events and not missed:
+                yield ": keep-alive\n\n"
+            cursor = head
+            await event_bus.wait(cursor, SSE_HEARTBEAT_SECONDS)
+            if await request.is_disconnected():
+                return
+    finally:
+        event_bus.subscribers -= 1
+
+
+def _event_stream(request: Request, last_event_id: str | None, project_id: int | None) -> StreamingResponse:
+    resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    return StreamingResponse(
+        _stream(request, resume_from, project_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/events", summary="Change feed for all projects (Server-Sent Events)")
+async def all_events(
+    request: Request,
+    _: None = Depends(verify_basic_auth),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    return _event_stream(request, last_event_id, None)
+
+
+@router.get("/projects/{project_id}/events", summary="Change feed for one project (Server-Sent Events)")
+async def project_events(
+    project_id: int,
+    request: Request,
+    _: None = Depends(verify_basic_auth),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    return _event_stream(request, last_event_id, project_id)
@@ -0,0 +1,20 @@
+"""
+Liveness and readiness probes (no auth).
+"""
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from services import health
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live", summary="Liveness probe (process is up; no I/O)")
+async def live():
+    return {"status": "ok"}
+
+
+@router.get("/ready", summary="Readiness probe (startup done, database reachable, Art Institute breaker state)")
+def ready():
+    is_ready, body = health.readiness()
+    return JSONResponse(body, status_code=status.HTTP_200_OK if is_ready else status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,23 @@
+"""
+Operational metrics (no auth, like the health check).
+"""
+from fastapi import APIRouter
+
+from middleware import admission
+from services import archive, artwork_search, event_bus, health, title_resolver
+from services.artic import breaker
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", summary="Background worker and queue metrics")
+def get_metrics():
+    return {
+        "admission": admission.stats(),
+        "title_resolver": title_resolver.stats(),
+        "artwork_search": artwork_search.stats(),
+        "events": event_bus.stats(),
+        "archive": archive.stats(),
+        "artic_breaker": breaker.state(),
+        "startup": health.startup_stats,
+    }
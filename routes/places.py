@@ -1,13 +1,14 @@
 """
 Place API routes (nested under projects).
 """
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
 from auth import verify_basic_auth
 from controllers import place_controller
 from database import get_db
 from schemas import PlaceCreate, PlaceListOut, PlaceOut, PlaceUpdate
+from services import run_idempotent
 
 router = APIRouter(prefix="/projects/{project_id}/places", tags=["places"])
 
@@ -38,8 +39,15 @@ async def add_place(
     payload: PlaceCreate,
     db: Session = Depends(get_db),
     _: None = Depends(verify_basic_auth),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", max_length=255),
 ):
-    return await place_controller.add_place(project_id, payload, db)
+    return await run_idempotent(
+        idempotency_key,
+        f"POST /projects/{project_id}/places",
+        payload,
+        lambda: place_controller.add_place(project_id, payload, db),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
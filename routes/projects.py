@@ -1,22 +1,33 @@
 """
 Project API routes.
 """
-from fastapi import APIRouter, Depends, Query, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from auth import verify_basic_auth
 from controllers import project_controller
 from database import get_db
 from schemas import (
+    ProjectBulkDeleteOut,
     ProjectCreate,
     ProjectDetailOut,
     ProjectListOut,
     ProjectOut,
     ProjectUpdate,
 )
+from services import run_idempotent
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+_FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return (id, name, description, start_date, "
+    "places_count, completed, places); only these are queried"
+)
+
 
 @router.post(
     "",
@@ -28,14 +39,21 @@ async def create_project(
     payload: ProjectCreate,
     db: Session = Depends(get_db),
     _: None = Depends(verify_basic_auth),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", max_length=255),
 ):
-    return await project_controller.create_project(payload, db)
+    return await run_idempotent(
+        idempotency_key,
+        "POST /projects",
+        payload,
+        lambda: project_controller.create_project(payload, db),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
     "",
     response_model=ProjectListOut,
-    summary="List travel projects (paginated, optional search and completed filter)",
+    summary="List travel projects (paginated, optional search and completed filter, multi-get by ids)",
 )
 def list_projects(
     db: Session = Depends(get_db),
@@ -44,21 +62,42 @@ def list_projects(
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None, max_length=200),
     completed: bool | None = Query(None),
+    ids: str | None = Query(None, max_length=1000, description="Comma-separated project IDs (multi-get)"),
+    fields: str | None = Query(None, max_length=200, description=_FIELDS_DESCRIPTION),
 ):
-    return project_controller.list_projects(db, skip=skip, limit=limit, search=search, completed=completed)
+    result = project_controller.list_projects(
+        db, skip=skip, limit=limit, search=search, completed=completed, ids=ids, fields=fields
+    )
+    # Sparse results do not match the full response model.
+    return JSONResponse(jsonable_encoder(result)) if fields is not None else result
 
 
 @router.get(
     "/{project_id}",
     response_model=ProjectDetailOut,
-    summary="Get a single project with its places",
+    summary="Get a single project with its places (falls back to archived projects)",
 )
 def get_project(
     project_id: int,
     db: Session = Depends(get_db),
     _: None = Depends(verify_basic_auth),
+    fields: str | None = Query(None, max_length=200, description=_FIELDS_DESCRIPTION),
+):
+    result = project_controller.get_project(project_id, db, fields=fields)
+    return JSONResponse(jsonable_encoder(result)) if fields is not None else result
+
+
+@router.post(
+    "/{project_id}/restore",
+    response_model=ProjectOut,
+    summary="Restore an archived project",
+)
+def restore_project(
+    project_id: int,
+    db: Session = Depends(get_db),
+    _: None = Depends(verify_basic_auth),
 ):
-    return project_controller.get_project(project_id, db)
+    return project_controller.restore_project(project_id, db)
 
 
 @router.put(
@@ -86,3 +125,23 @@ def delete_project(
     _: None = Depends(verify_basic_auth),
 ):
     project_controller.delete_project(project_id, db)
+
+
+@router.delete(
+    "",
+    response_model=ProjectBulkDeleteOut,
+    summary="Delete all projects matching the filters (skips projects with visited places)",
+)
+def bulk_delete_projects(
+    db: Session = Depends(get_db),
+    _: None = Depends(verify_basic_auth),
+    search: str | None = Query(None, max_length=200),
+    completed: bool | None = Query(None),
+    ids: str | None = Query(None, max_length=1000, description="Comma-separated project IDs"),
+    updated_before: datetime | None = Query(
+        None, description="Only projects whose project row and places were all last updated before this time"
+    ),
+):
+    return project_controller.bulk_delete_projects(
+        db, search=search, completed=completed, ids=ids, updated_before=updated_before
+    )
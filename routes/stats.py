@@ -0,0 +1,37 @@
+"""
+Analytics routes (served from incrementally maintained aggregates).
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from auth import verify_basic_auth
+from database import get_db
+from schemas import PopularArtworksOut, ProjectStatsOut
+from services import analytics
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get(
+    "/projects",
+    response_model=ProjectStatsOut,
+    summary="Project counts, completion rate and places per project",
+)
+def project_stats(
+    db: Session = Depends(get_db),
+    _: None = Depends(verify_basic_auth),
+):
+    return analytics.project_summary(db)
+
+
+@router.get(
+    "/artworks/popular",
+    response_model=PopularArtworksOut,
+    summary="Most-added artworks",
+)
+def popular_artworks(
+    db: Session = Depends(get_db),
+    _: None = Depends(verify_basic_auth),
+    limit: int = Query(10, ge=1, le=100),
+):
+    return {"items": analytics.popular_artworks(db, limit=limit)}
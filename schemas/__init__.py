@@ -1,9 +1,12 @@
 """
 Pydantic schemas for request/response and serialization.
 """
+from schemas.artwork import ArtworkOut, ArtworkSearchOut, artwork_record_to_out, artwork_to_out
 from schemas.common import PaginationParams, ProjectListParams
 from schemas.place import PlaceCreate, PlaceListOut, PlaceOut, PlaceUpdate
+from schemas.stats import PopularArtworkOut, PopularArtworksOut, ProjectStatsOut
 from schemas.project import (
+    ProjectBulkDeleteOut,
     ProjectCreate,
     ProjectDetailOut,
     ProjectListOut,
@@ -15,12 +18,20 @@ from schemas.project import (
 )
 
 __all__ = [
+    "ArtworkOut",
+    "ArtworkSearchOut",
+    "artwork_record_to_out",
+    "artwork_to_out",
     "PaginationParams",
     "ProjectListParams",
     "PlaceCreate",
     "PlaceListOut",
     "PlaceOut",
     "PlaceUpdate",
+    "PopularArtworkOut",
+    "PopularArtworksOut",
+    "ProjectStatsOut",
+    "ProjectBulkDeleteOut",
     "ProjectCreate",
     "ProjectDetailOut",
     "ProjectListOut",
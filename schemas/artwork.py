@@ -0,0 +1,51 @@
+"""
+Artwork response schemas and serializers.
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from config import ARTIC_IIIF_URL
+
+
+class ArtworkOut(BaseModel):
+    external_id: str
+    title: Optional[str] = None
+    artist_display: Optional[str] = None
+    date_display: Optional[str] = None
+    image_id: Optional[str] = None
+    image_url: Optional[str] = None
+    gallery_title: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ArtworkSearchOut(BaseModel):
+    """Paginated artwork search results."""
+    # Normalized query the results are for (a newer, related query when debounced).
+    query: str
+    items: List[ArtworkOut]
+    total: int
+
+
+def _image_url(image_id: Optional[str]) -> Optional[str]:
+    return f"{ARTIC_IIIF_URL}/{image_id}/full/843,/0/default.jpg" if image_id else None
+
+
+def artwork_record_to_out(record: dict) -> ArtworkOut:
+    """Serialize an artwork record dict (as returned by services.artic)."""
+    return ArtworkOut(**record, image_url=_image_url(record.get("image_id")))
+
+
+def artwork_to_out(artwork) -> ArtworkOut:
+    image_url = _image_url(artwork.image_id)
+    return ArtworkOut(
+        external_id=artwork.external_id,
+        title=artwork.title,
+        artist_display=artwork.artist_display,
+        date_display=artwork.date_display,
+        image_id=artwork.image_id,
+        image_url=image_url,
+        gallery_title=artwork.gallery_title,
+    )
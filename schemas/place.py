@@ -5,6 +5,8 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from schemas.artwork import ArtworkOut
+
 
 class PlaceBase(BaseModel):
     external_id: Union[int, str] = Field(..., description="Art Institute external ID")
@@ -25,8 +27,10 @@ class PlaceOut(BaseModel):
     project_id: int
     external_id: str
     title: Optional[str] = None
+    title_status: str = Field("resolved", description="resolved | pending | invalid | failed")
     notes: Optional[str]
     visited: bool
+    artwork: Optional[ArtworkOut] = None
 
     class Config:
         from_attributes = True
@@ -7,6 +7,7 @@ from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 
 from models import Project
+from schemas.artwork import artwork_to_out
 from schemas.place import PlaceOut
 
 
@@ -42,6 +43,7 @@ class ProjectOut(BaseModel):
 
 class ProjectDetailOut(ProjectOut):
     places: List[PlaceOut]
+    archived: bool = False
 
 
 class ProjectListOut(BaseModel):
@@ -56,6 +58,11 @@ class ProjectListOut(BaseModel):
     total: int
 
 
+class ProjectBulkDeleteOut(BaseModel):
+    """Result of a bulk delete."""
+    deleted: int
+
+
 def _places_sorted_newest_first(places: list) -> list:
     return sorted(places or [], key=lambda p: p.id, reverse=True)
 
@@ -74,31 +81,24 @@ def project_to_out(project: Project) -> ProjectOut:
     )
 
 
-def project_to_detail_out(project: Project) -> ProjectDetailOut:
+def project_to_detail_out(project: Project, include_artworks: bool = False) -> ProjectDetailOut:
     base = project_to_out(project)
     ordered = _places_sorted_newest_first(project.places)
     return ProjectDetailOut(
         **base.model_dump(),
-        places=[
-            PlaceOut(
-                id=p.id,
-                project_id=p.project_id,
-                external_id=p.external_id,
-                title=getattr(p, "title", None),
-                notes=p.notes,
-                visited=p.visited,
-            )
-            for p in ordered
-        ],
+        places=[place_to_out(p, include_artwork=include_artworks) for p in ordered],
     )
 
 
-def place_to_out(place) -> PlaceOut:
+def place_to_out(place, include_artwork: bool = False) -> PlaceOut:
+    artwork = place.artwork if include_artwork else None
     return PlaceOut(
         id=place.id,
         project_id=place.project_id,
         external_id=place.external_id,
         title=getattr(place, "title", None),
+        title_status=place.title_status,
         notes=place.notes,
         visited=place.visited,
+        artwork=artwork_to_out(artwork) if artwork is not None else None,
     )
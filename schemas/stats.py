@@ -0,0 +1,27 @@
+"""
+Analytics response schemas.
+"""
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ProjectStatsOut(BaseModel):
+    projects: int
+    completed_projects: int
+    completion_rate: float
+    places: int
+    visited_places: int
+    avg_places_per_project: float
+    places_per_project: Dict[int, int]
+
+
+class PopularArtworkOut(BaseModel):
+    external_id: str
+    title: Optional[str] = None
+    added_count: int
+    visited_count: int
+
+
+class PopularArtworksOut(BaseModel):
+    items: List[PopularArtworkOut]
@@ -0,0 +1,6 @@
+"""
+Command-line jobs (run from cron or by hand), e.g. ``python -m scripts.archive_projects``.
+
+Kept out of the services package so ``python -m`` never runs a module that the
+package has already imported (which would create a second copy of its state).
+"""
@@ -0,0 +1,21 @@
+"""
+Archive completed, inactive projects (see services.archive).
+
+    python -m scripts.archive_projects
+"""
+from database import SessionLocal, init_db
+from services.archive import archive_projects
+
+
+def main() -> None:
+    init_db()
+    session = SessionLocal()
+    try:
+        count = archive_projects(session)
+    finally:
+        session.close()
+    print(f"Archived {count} project(s)")
+
+
+if __name__ == "__main__":
+    main()
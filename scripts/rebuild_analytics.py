@@ -0,0 +1,27 @@
+"""
+Rebuild the analytics aggregates, or check them with --verify.
+
+    python -m scripts.rebuild_analytics [--verify]
+"""
+import sys
+
+from database import SessionLocal, init_db
+from services import analytics
+
+
+def main() -> None:
+    init_db()
+    session = SessionLocal()
+    try:
+        if "--verify" in sys.argv:
+            issues = analytics.verify(session)
+            print("\n".join(issues) or "Analytics are consistent")
+            sys.exit(1 if issues else 0)
+        analytics.rebuild(session)
+        print("Analytics rebuilt")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
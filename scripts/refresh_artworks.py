@@ -0,0 +1,23 @@
+"""
+Re-pull stale artwork metadata (and fill in artworks for older places).
+
+    python -m scripts.refresh_artworks
+"""
+import asyncio
+
+from database import SessionLocal, init_db
+from services.artwork_store import refresh_artworks
+
+
+def main() -> None:
+    init_db()
+    session = SessionLocal()
+    try:
+        count = asyncio.run(refresh_artworks(session))
+    finally:
+        session.close()
+    print(f"Refreshed {count} artwork(s)")
+
+
+if __name__ == "__main__":
+    main()
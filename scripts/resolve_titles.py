@@ -0,0 +1,23 @@
+"""
+Queue every place without a title (including failed ones) and wait until resolved.
+
+    python -m scripts.resolve_titles
+"""
+from database import SessionLocal, init_db
+from services.title_worker import backfill_missing_titles, title_resolver
+
+
+def main() -> None:
+    init_db()
+    session = SessionLocal()
+    try:
+        queued = backfill_missing_titles(session)
+    finally:
+        session.close()
+    print(f"Queued {queued} place(s) for title resolution")
+    title_resolver.wait_for_drain()
+    print(title_resolver.stats())
+
+
+if __name__ == "__main__":
+    main()
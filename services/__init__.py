@@ -1,7 +1,42 @@
 """
 Business and external services.
 """
-from services.artic import fetch_artwork_title
+from services import analytics, archive, artwork_search, health
+from services.artic import (
+    fetch_artwork,
+    fetch_artwork_title,
+    fetch_artwork_titles,
+    fetch_artworks,
+    search_artworks,
+)
+from services.artwork_store import ensure_artworks, get_artworks, refresh_artworks, store_artworks
 from services.cache import TTLCache
+from services.events import event_bus
+from services.idempotency import run_idempotent
+from services.title_worker import (
+    backfill_missing_titles,
+    requeue_pending_titles,
+    title_resolver,
+)
 
-__all__ = ["fetch_artwork_title", "TTLCache"]
+__all__ = [
+    "fetch_artwork",
+    "fetch_artwork_title",
+    "fetch_artwork_titles",
+    "fetch_artworks",
+    "search_artworks",
+    "artwork_search",
+    "analytics",
+    "archive",
+    "health",
+    "ensure_artworks",
+    "get_artworks",
+    "refresh_artworks",
+    "store_artworks",
+    "TTLCache",
+    "event_bus",
+    "run_idempotent",
+    "backfill_missing_titles",
+    "requeue_pending_titles",
+    "title_resolver",
+]
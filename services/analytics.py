@@ -0,0 +1,288 @@
+"""
+Incrementally maintained analytics.
+
+Controller write paths call the record_* functions inside their own transaction,
+so the aggregate tables (stats_counters, project_stats, artwork_stats) change
+atomically with the data. Reads never scan projects or project_places.
+rebuild() recomputes everything from the base tables; verify() reports drift.
+Places whose artwork ID turned out not to exist (title_status "invalid") do not
+count towards artwork_stats.
+"""
+from typing import Iterable
+
+from sqlalchemy import Integer, bindparam, delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from config import MAX_PLACES_PER_PROJECT
+from models import (
+    ArchivedProject,
+    ArchivedProjectPlace,
+    Artwork,
+    ArtworkStats,
+    Project,
+    ProjectPlace,
+    ProjectStats,
+    StatsCounter,
+)
+from models.project_place import TITLE_STATUS_INVALID
+
+PROJECTS = "projects"
+COMPLETED_PROJECTS = "completed_projects"
+PLACES = "places"
+VISITED_PLACES = "visited_places"
+
+
+def _histogram_key(places_count: int) -> str:
+    return f"places_per_project:{places_count}"
+
+
+def _is_completed(places_count: int, visited_count: int) -> bool:
+    return places_count > 0 and visited_count == places_count
+
+
+def _bump(db: Session, name: str, delta: int) -> None:
+    if not delta:
+        return
+    stmt = insert(StatsCounter).values(name=name, value=delta)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[StatsCounter.name],
+        set_={"value": StatsCounter.value + delta},
+    ))
+
+
+def _bump_artwork(db: Session, external_id: str, added: int = 0, visited: int = 0) -> None:
+    stmt = insert(ArtworkStats).values(external_id=external_id, added_count=added, visited_count=visited)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[ArtworkStats.external_id],
+        set_={
+            "added_count": ArtworkStats.added_count + added,
+            "visited_count": ArtworkStats.visited_count + visited,
+        },
+    ))
+
+
+def _apply_project_change(db: Session, project_id: int, places_delta: int, visited_delta: int) -> None:
+    # Increment in SQL (not read-modify-write in Python) so concurrent writers to the
+    # same project cannot lose updates; transitions come from the returned values.
+    stmt = insert(ProjectStats).values(
+        project_id=project_id, places_count=places_delta, visited_count=visited_delta
+    )
+    after = db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ProjectStats.project_id],
+            set_={
+                "places_count": ProjectStats.places_count + places_delta,
+                "visited_count": ProjectStats.visited_count + visited_delta,
+            },
+        ).returning(ProjectStats.places_count, ProjectStats.visited_count),
+        execution_options={"synchronize_session": False},
+    ).one()
+    after = (after.places_count, after.visited_count)
+    before = (after[0] - places_delta, after[1] - visited_delta)
+    if before[0] != after[0]:
+        _bump(db, _histogram_key(before[0]), -1)
+        _bump(db, _histogram_key(after[0]), 1)
+    _bump(db, COMPLETED_PROJECTS, int(_is_completed(*after)) - int(_is_completed(*before)))
+    _bump(db, PLACES, places_delta)
+    _bump(db, VISITED_PLACES, visited_delta)
+
+
+# --- write paths -------------------------------------------------------------
+
+def record_project_created(db: Session, project_id: int, external_ids: Iterable[str]) -> None:
+    external_ids = list(external_ids)
+    db.add(ProjectStats(project_id=project_id, places_count=len(external_ids), visited_count=0))
+    _bump(db, PROJECTS, 1)
+    _bump(db, PLACES, len(external_ids))
+    _bump(db, _histogram_key(len(external_ids)), 1)
+    for eid in external_ids:
+        _bump_artwork(db, eid, added=1)
+
+
+def record_place_added(db: Session, project_id: int, external_id: str) -> None:
+    _apply_project_change(db, project_id, places_delta=1, visited_delta=0)
+    _bump_artwork(db, external_id, added=1)
+
+
+def record_visited_changed(
+    db: Session, project_id: int, external_id: str, visited: bool, count_artwork: bool = True
+) -> None:
+    """
+    Call only when a place's visited flag actually flips. Pass count_artwork=False
+    for places with an invalid artwork ID.
+    """
+    delta = 1 if visited else -1
+    _apply_project_change(db, project_id, places_delta=0, visited_delta=delta)
+    if count_artwork:
+        _bump_artwork(db, external_id, visited=delta)
+
+
+def record_place_invalid(db: Session, external_id: str, visited: bool) -> None:
+    """Call when a place's artwork ID is found not to exist (async title mode)."""
+    _bump_artwork(db, external_id, added=-1, visited=-int(visited))
+
+
+def record_projects_deleting(db: Session, project_ids) -> None:
+    """
+    Call right before deleting the projects selected by project_ids (a SELECT of
+    project IDs), in the same transaction. Deletable projects have no visited
+    places, so they are never completed and never count towards visited totals.
+    """
+    buckets = db.execute(
+        select(ProjectStats.places_count, func.count())
+        .where(ProjectStats.project_id.in_(project_ids))
+        .group_by(ProjectStats.places_count)
+    ).all()
+    if not buckets:
+        return
+    for places_count, count in buckets:
+        _bump(db, _histogram_key(places_count), -count)
+        _bump(db, PROJECTS, -count)
+        _bump(db, PLACES, -places_count * count)
+
+    artwork_counts = db.execute(
+        select(ProjectPlace.external_id, func.count())
+        .where(
+            ProjectPlace.project_id.in_(project_ids),
+            ProjectPlace.title_status != TITLE_STATUS_INVALID,
+        )
+        .group_by(ProjectPlace.external_id)
+    ).all()
+    if artwork_counts:
+        db.connection().execute(
+            update(ArtworkStats.__table__)
+            .where(ArtworkStats.__table__.c.external_id == bindparam("eid"))
+            .values(added_count=ArtworkStats.__table__.c.added_count - bindparam("count")),
+            [{"eid": eid, "count": count} for eid, count in artwork_counts],
+        )
+    db.execute(
+        delete(ProjectStats).where(ProjectStats.project_id.in_(project_ids)),
+        execution_options={"synchronize_session": False},
+    )
+
+
+# --- reads -------------------------------------------------------------------
+
+def _counters(db: Session) -> dict[str, int]:
+    return {name: value for name, value in db.query(StatsCounter.name, StatsCounter.value)}
+
+
+def project_summary(db: Session) -> dict:
+    counters = _counters(db)
+    projects = counters.get(PROJECTS, 0)
+    completed = counters.get(COMPLETED_PROJECTS, 0)
+    places = counters.get(PLACES, 0)
+    return {
+        "projects": projects,
+        "completed_projects": completed,
+        "completion_rate": completed / projects if projects else 0.0,
+        "places": places,
+        "visited_places": counters.get(VISITED_PLACES, 0),
+        "avg_places_per_project": places / projects if projects else 0.0,
+        "places_per_project": {
+            n: counters.get(_histogram_key(n), 0) for n in range(MAX_PLACES_PER_PROJECT + 1)
+        },
+    }
+
+
+def popular_artworks(db: Session, limit: int = 10) -> list[dict]:
+    rows = (
+        db.query(ArtworkStats, Artwork.title)
+        .outerjoin(Artwork, Artwork.external_id == ArtworkStats.external_id)
+        .filter(ArtworkStats.added_count > 0)
+        .order_by(ArtworkStats.added_count.desc(), ArtworkStats.external_id)
+        .limit(limit)
+        .all()
+    )
+    return [
+        {
+            "external_id": stats.external_id,
+            "title": title,
+            "added_count": stats.added_count,
+            "visited_count": stats.visited_count,
+        }
+        for stats, title in rows
+    ]
+
+
+# --- full rebuild ------------------------------------------------------------
+
+def _compute(db: Session) -> tuple[dict[str, int], dict[int, tuple[int, int]], dict[str, tuple[int, int]]]:
+    """
+    Aggregates computed from scratch: (counters, per-project, per-artwork).
+    Archived projects count too (see services.archive).
+    """
+    per_project: dict[int, tuple[int, int]] = {}
+    per_artwork: dict[str, tuple[int, int]] = {}
+    for project_model, place_model in ((Project, ProjectPlace), (ArchivedProject, ArchivedProjectPlace)):
+        visited = func.coalesce(func.sum(func.cast(place_model.visited, Integer)), 0)
+        for pid, places, visited_count in (
+            db.query(project_model.id, func.count(place_model.id), visited)
+            .outerjoin(place_model, place_model.project_id == project_model.id)
+            .group_by(project_model.id)
+        ):
+            per_project[pid] = (places, visited_count)
+        for eid, added, visited_count in (
+            db.query(place_model.external_id, func.count(place_model.id), visited)
+            .filter(place_model.title_status != TITLE_STATUS_INVALID)
+            .group_by(place_model.external_id)
+        ):
+            a, v = per_artwork.get(eid, (0, 0))
+            per_artwork[eid] = (a + added, v + visited_count)
+    counters = {
+        PROJECTS: len(per_project),
+        COMPLETED_PROJECTS: sum(_is_completed(*v) for v in per_project.values()),
+        PLACES: sum(p for p, _ in per_project.values()),
+        VISITED_PLACES: sum(v for _, v in per_project.values()),
+    }
+    for places, _ in per_project.values():
+        key = _histogram_key(places)
+        counters[key] = counters.get(key, 0) + 1
+    return counters, per_project, per_artwork
+
+
+def rebuild(db: Session) -> None:
+    """Replace all aggregate tables with values recomputed from the base tables."""
+    counters, per_project, per_artwork = _compute(db)
+    db.execute(delete(StatsCounter))
+    db.execute(delete(ProjectStats))
+    db.execute(delete(ArtworkStats))
+    db.add_all(StatsCounter(name=k, value=v) for k, v in counters.items())
+    db.add_all(
+        ProjectStats(project_id=pid, places_count=p, visited_count=v)
+        for pid, (p, v) in per_project.items()
+    )
+    db.add_all(
+        ArtworkStats(external_id=eid, added_count=a, visited_count=v)
+        for eid, (a, v) in per_artwork.items()
+    )
+    db.commit()
+
+
+def verify(db: Session) -> list[str]:
+    """Differences between stored and recomputed aggregates (empty = consistent)."""
+    counters, per_project, per_artwork = _compute(db)
+    problems = []
+    stored_counters = {k: v for k, v in _counters(db).items() if v}
+    expected_counters = {k: v for k, v in counters.items() if v}
+    for name in sorted(set(stored_counters) | set(expected_counters)):
+        if stored_counters.get(name) != expected_counters.get(name):
+            problems.append(f"counter {name}: stored {stored_counters.get(name, 0)}, expected {expected_counters.get(name, 0)}")
+    stored_projects = {s.project_id: (s.places_count, s.visited_count) for s in db.query(ProjectStats)}
+    for pid in sorted(set(stored_projects) | set(per_project)):
+        if stored_projects.get(pid) != per_project.get(pid):
+            problems.append(f"project {pid}: stored {stored_projects.get(pid)}, expected {per_project.get(pid)}")
+    stored_artworks = {
+        s.external_id: (s.added_count, s.visited_count)
+        for s in db.query(ArtworkStats)
+        if s.added_count or s.visited_count
+    }
+    for eid in sorted(set(stored_artworks) | set(per_artwork)):
+        if stored_artworks.get(eid) != per_artwork.get(eid):
+            problems.append(f"artwork {eid}: stored {stored_artworks.get(eid)}, expected {per_artwork.get(eid)}")
+    return problems
+
+
+def is_initialized(db: Session) -> bool:
+    return db.get(StatsCounter, PROJECTS) is not None
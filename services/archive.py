@@ -0,0 +1,185 @@
+"""
+Hot/cold archival of finished projects.
+
+Completed projects with no project or place update for ARCHIVE_AFTER_DAYS are moved
+(set-based INSERT ... SELECT, then DELETE with cascade) into archived_projects /
+archived_project_places, one short transaction per batch so online writes are
+never blocked for long. Archived projects stay readable through the
+GET /projects/{id} fallback and can be restored with the same IDs (projects and
+project_places use AUTOINCREMENT, so archived IDs are never handed out again). Analytics
+keep counting archived projects, so archiving does not touch the aggregates.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_PAUSE, ARCHIVE_BATCH_SIZE
+from models import ArchivedProject, ArchivedProjectPlace, Project, ProjectPlace
+from services.events import event_bus
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_COLUMNS = ("id", "name", "description", "start_date", "created_at", "updated_at")
+_PLACE_COLUMNS = (
+    "id", "project_id", "external_id", "title", "title_status", "notes", "visited", "created_at", "updated_at",
+)
+
+_stats = {
+    "runs": 0,
+    "archived_total": 0,
+    "restored_total": 0,
+    "last_run_at": None,
+    "last_run_seconds": None,
+    "last_run_archived": 0,
+}
+_lock = threading.Lock()
+
+
+def inactive_since(cutoff: datetime):
+    """
+    Conditions for "neither the project nor any of its places updated since cutoff"
+    (adding or visiting a place does not touch projects.updated_at). Shared by
+    archival and bulk delete (updated_before).
+    """
+    has_recent_place = (
+        select(ProjectPlace.id)
+        .where(ProjectPlace.project_id == Project.id, ProjectPlace.updated_at >= cutoff)
+        .exists()
+    )
+    return (Project.updated_at < cutoff, ~has_recent_place)
+
+
+def _archivable(cutoff: datetime):
+    """Policy: completed (has places, none unvisited) and inactive since cutoff."""
+    has_places = select(ProjectPlace.id).where(ProjectPlace.project_id == Project.id).exists()
+    has_unvisited = (
+        select(ProjectPlace.id)
+        .where(ProjectPlace.project_id == Project.id, ProjectPlace.visited.is_(False))
+        .exists()
+    )
+    return (has_places, ~has_unvisited, *inactive_since(cutoff))
+
+
+def _move(db: Session, ids: list[int], source, source_place, target, target_place, *conditions) -> None:
+    """
+    Copy projects (and their places) with the given IDs that still satisfy conditions
+    from source to target tables, then delete them from source (places cascade).
+    """
+    db.execute(
+        insert(target).from_select(
+            list(_PROJECT_COLUMNS),
+            select(*(getattr(source, c) for c in _PROJECT_COLUMNS)).where(source.id.in_(ids), *conditions),
+        )
+    )
+    # The first INSERT took the write lock; from here on, move exactly what was copied.
+    ids = select(target.id).where(target.id.in_(ids))
+    db.execute(
+        insert(target_place).from_select(
+            list(_PLACE_COLUMNS),
+            select(*(getattr(source_place, c) for c in _PLACE_COLUMNS)).where(
+                source_place.project_id.in_(ids)
+            ),
+        )
+    )
+    db.execute(delete(source).where(source.id.in_(ids)), execution_options={"synchronize_session": False})
+
+
+def archive_projects(
+    db: Session,
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    pause: float = ARCHIVE_BATCH_PAUSE,
+    max_batches: Optional[int] = None,
+) -> int:
+    """Archive all projects matching the policy, in batches. Returns the number archived."""
+    started = time.monotonic()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    archived = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(
+            db.execute(
+                select(Project.id).where(*_archivable(cutoff)).order_by(Project.id).limit(batch_size)
+            ).scalars()
+        )
+        if not ids:
+            break
+        selected = len(ids)
+        # Re-check the policy inside the write transaction (a place may have changed meanwhile).
+        _move(db, ids, Project, ProjectPlace, ArchivedProject, ArchivedProjectPlace, *_archivable(cutoff))
+        db.commit()
+        ids = list(db.execute(select(ArchivedProject.id).where(ArchivedProject.id.in_(ids))).scalars())
+        for pid in ids:
+            event_bus.publish("project.archived", pid)
+        archived += len(ids)
+        batches += 1
+        if selected < batch_size:
+            break
+        # Let online writers take the SQLite write lock between batches.
+        time.sleep(pause)
+
+    with _lock:
+        _stats["runs"] += 1
+        _stats["archived_total"] += archived
+        _stats["last_run_at"] = datetime.now(timezone.utc).isoformat()
+        _stats["last_run_seconds"] = round(time.monotonic() - started, 3)
+        _stats["last_run_archived"] = archived
+    return archived
+
+
+def get_archived_project(db: Session, project_id: int) -> Optional[ArchivedProject]:
+    return db.get(ArchivedProject, project_id)
+
+
+def restore_project(db: Session, project_id: int) -> None:
+    """Move an archived project back into the working tables (same IDs)."""
+    if db.get(ArchivedProject, project_id) is None:
+        raise HTTPException(status_code=404, detail="Archived project not found")
+    conflict = HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="The archived project's IDs are already in use",
+    )
+    if db.query(Project.id).filter(Project.id == project_id).first() is not None:
+        raise conflict
+    try:
+        _move(db, [project_id], ArchivedProject, ArchivedProjectPlace, Project, ProjectPlace)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise conflict
+    event_bus.publish("project.restored", project_id)
+    with _lock:
+        _stats["restored_total"] += 1
+
+
+def stats() -> dict:
+    """In-process counters only (served by the unauthenticated GET /metrics; no DB work)."""
+    with _lock:
+        return dict(_stats)
+
+
+def start_periodic_archiver(interval_seconds: int) -> threading.Thread:
+    """Run archive_projects every interval_seconds in a daemon thread."""
+    from database import SessionLocal
+
+    def run() -> None:
+        while True:
+            time.sleep(interval_seconds)
+            db = SessionLocal()
+            try:
+                archive_projects(db)
+            except Exception:
+                logger.exception("Archival run failed")
+            finally:
+                db.close()
+
+    thread = threading.Thread(target=run, name="project-archiver", daemon=True)
+    thread.start()
+    return thread
@@ -1,14 +1,21 @@
 """
 Art Institute of Chicago API client (with optional response caching).
 """
-from typing import Optional
+import threading
+import time
+from typing import TYPE_CHECKING, List, Optional
 
-import httpx
 from fastapi import HTTPException, status
 
-from config import ARTIC_BASE_URL, ARTIC_CACHE_TTL
+from config import ARTIC_BASE_URL, ARTIC_BREAKER_COOLDOWN, ARTIC_BREAKER_THRESHOLD, ARTIC_CACHE_TTL
 from services.cache import TTLCache
 
+if TYPE_CHECKING:
+    import httpx
+
+# Fields pulled for every artwork (stored locally in the artworks table).
+ARTWORK_FIELDS = ("id", "title", "artist_display", "date_display", "image_id", "gallery_title")
+
 _artwork_cache: Optional[TTLCache] = None
 
 
@@ -19,10 +26,109 @@ def _get_cache() -> Optional[TTLCache]:
     return _artwork_cache
 
 
-async def fetch_artwork_title(external_id: str) -> Optional[str]:
+class CircuitBreaker:
     """
-    Fetch artwork from Art Institute of Chicago API.
-    Returns the title if found; raises HTTPException(400) if not found.
+    Stops calling the Art Institute API for `cooldown` seconds after `threshold`
+    consecutive failures (connection errors or 5xx). After the cooldown it is
+    half-open: a single trial call goes through while other callers keep failing
+    fast; its success closes the breaker, its failure opens it again.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        # When the half-open trial call started (None = no trial running).
+        self._trial_started: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Ask to make a call. Returns 0 if allowed, else seconds to wait before retrying."""
+        now = time.monotonic()
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            wait = self._opened_at + self._cooldown - now
+            if wait > 0:
+                return wait
+            # Half-open. A trial that never reported back (e.g. cancelled) expires
+            # after another cooldown so the breaker cannot get stuck.
+            if self._trial_started is not None and now < self._trial_started + self._cooldown:
+                return self._trial_started + self._cooldown - now
+            self._trial_started = now
+            return 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started = None
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+            self._trial_started = None
+            if self._threshold > 0 and self._failures >= self._threshold:
+                self._opened_at = time.monotonic()
+
+    def state(self) -> dict:
+        with self._lock:
+            if self._opened_at is None:
+                name = "closed"
+            elif time.monotonic() < self._opened_at + self._cooldown:
+                name = "open"
+            else:
+                name = "half-open"
+            return {"state": name, "consecutive_failures": self._failures, "last_error": self._last_error}
+
+
+breaker = CircuitBreaker(threshold=ARTIC_BREAKER_THRESHOLD, cooldown=ARTIC_BREAKER_COOLDOWN)
+
+
+async def _upstream_get(url: str, params: dict, timeout: float) -> "httpx.Response":
+    """
+    GET from the Art Institute API through the circuit breaker.
+    Raises HTTPException(503) while the breaker is open, HTTPException(502) if unreachable.
+    """
+    # Imported here so that importing the app does not pay for httpx.
+    import httpx
+
+    wait = breaker.acquire()
+    if wait > 0:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Art Institute API is temporarily unavailable",
+            headers={"Retry-After": str(int(wait) + 1)},
+        )
+    try:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            resp = await client.get(url, params=params)
+    except httpx.RequestError as exc:
+        breaker.record_failure(str(exc))
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Failed to contact Art Institute API: {exc}",
+        )
+    if resp.status_code >= 500:
+        breaker.record_failure(f"HTTP {resp.status_code}")
+    else:
+        breaker.record_success()
+    return resp
+
+
+def _artwork_record(item: dict) -> dict:
+    """Keep only ARTWORK_FIELDS (minus the ID) from an API artwork payload."""
+    return {field: item.get(field) for field in ARTWORK_FIELDS if field != "id"}
+
+
+async def fetch_artwork(external_id: str) -> dict:
+    """
+    Fetch artwork metadata (ARTWORK_FIELDS) from Art Institute of Chicago API.
+    Raises HTTPException(400) if not found, HTTPException(502) if unreachable,
+    HTTPException(503) while the circuit breaker is open.
     Uses in-memory cache when ARTIC_CACHE_TTL > 0.
     """
     cache = _get_cache()
@@ -31,25 +137,108 @@ async def fetch_artwork_title(external_id: str) -> Optional[str]:
         if cached is not None:
             return cached
     url = f"{ARTIC_BASE_URL}/artworks/{external_id}"
+    resp = await _upstream_get(url, {"fields": ",".join(ARTWORK_FIELDS)}, timeout=5.0)
+
+    if resp.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Artwork with id {external_id} does not exist in Art Institute API",
+        )
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(url)
-    except httpx.RequestError as exc:
+        record = _artwork_record(resp.json().get("data") or {})
+    except Exception:
+        return _artwork_record({})
+    if cache:
+        cache.set(f"artwork:{external_id}", record)
+    return record
+
+
+async def fetch_artwork_title(external_id: str) -> Optional[str]:
+    """
+    Fetch artwork from Art Institute of Chicago API.
+    Returns the title if found; raises HTTPException(400) if not found.
+    """
+    return (await fetch_artwork(external_id)).get("title")
+
+
+async def fetch_artworks(external_ids: List[str]) -> dict[str, dict]:
+    """
+    Fetch metadata for several artworks with a single request (``/artworks?ids=...``).
+    Returns a mapping for the IDs the API knows about; unknown IDs are absent.
+    Raises HTTPException(502) if the API cannot be reached or answers with an error.
+    Uses (and fills) the same in-memory cache as fetch_artwork.
+    """
+    cache = _get_cache()
+    result: dict[str, dict] = {}
+    missing: List[str] = []
+    for eid in external_ids:
+        cached = cache.get(f"artwork:{eid}") if cache else None
+        if cached is not None:
+            result[eid] = cached
+        else:
+            missing.append(eid)
+    if not missing:
+        return result
+
+    url = f"{ARTIC_BASE_URL}/artworks"
+    params = {"ids": ",".join(missing), "fields": ",".join(ARTWORK_FIELDS), "limit": len(missing)}
+    resp = await _upstream_get(url, params, timeout=10.0)
+    if resp.status_code != 200:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to contact Art Institute API: {exc}",
+            detail=f"Art Institute API returned {resp.status_code}",
         )
+    try:
+        items = resp.json().get("data") or []
+    except Exception:
+        items = []
+    for item in items:
+        if not item or item.get("id") is None:
+            continue
+        eid = str(item["id"])
+        record = _artwork_record(item)
+        result[eid] = record
+        if cache:
+            cache.set(f"artwork:{eid}", record)
+    return result
+
+
+async def fetch_artwork_titles(external_ids: List[str]) -> dict[str, Optional[str]]:
+    """Batch variant of fetch_artwork_title (see fetch_artworks)."""
+    records = await fetch_artworks(external_ids)
+    return {eid: record.get("title") for eid, record in records.items()}
 
+
+async def search_artworks(query: str, page: int = 1, limit: int = 20) -> tuple[List[dict], int]:
+    """
+    Full-text artwork search (``/artworks/search``). Returns ``(items, total)``
+    where each item is an artwork record plus ``external_id``.
+    Every hit is put into the per-artwork cache, so adding it as a place
+    afterwards needs no further upstream call.
+    Raises HTTPException(502) if the API cannot be reached or answers with an error.
+    """
+    url = f"{ARTIC_BASE_URL}/artworks/search"
+    params = {"q": query, "page": page, "limit": limit, "fields": ",".join(ARTWORK_FIELDS)}
+    resp = await _upstream_get(url, params, timeout=5.0)
     if resp.status_code != 200:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Artwork with id {external_id} does not exist in Art Institute API",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Art Institute API returned {resp.status_code}",
         )
     try:
-        data = resp.json()
-        title = (data.get("data") or {}).get("title")
-        if cache and title is not None:
-            cache.set(f"artwork:{external_id}", title)
-        return title
+        payload = resp.json()
     except Exception:
-        return None
+        return [], 0
+
+    cache = _get_cache()
+    items: List[dict] = []
+    for item in payload.get("data") or []:
+        if not item or item.get("id") is None:
+            continue
+        eid = str(item["id"])
+        record = _artwork_record(item)
+        if cache:
+            cache.set(f"artwork:{eid}", record)
+        items.append({"external_id": eid, **record})
+    total = (payload.get("pagination") or {}).get("total", len(items))
+    return items, total
@@ -0,0 +1,158 @@
+"""
+Cached, coalesced and debounced artwork search for the place picker.
+
+Results are cached per normalized query, page and page size. Concurrent
+identical searches share one upstream request. Results for a shorter prefix are
+never filtered locally for a longer query: the upstream search is full-text
+(whole-word matching over many fields), so they are not a superset of the
+longer query's results.
+
+Search-as-you-type is debounced on the server: a first-page search waits
+ARTIC_SEARCH_DEBOUNCE seconds before going upstream, and if the same client
+sends a related query (one extends or shortens the other) meanwhile, the older
+search is dropped and answered with the newest completed search from that
+client. Every result carries the query it is for, so clients can tell.
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+
+from config import ARTIC_SEARCH_CACHE_TTL, ARTIC_SEARCH_DEBOUNCE
+from services.artic import search_artworks
+from services.cache import TTLCache
+
+_MAX_SESSIONS = 10_000
+
+_search_cache: Optional[TTLCache] = None
+_inflight: dict[str, asyncio.Future] = {}
+_counters = {"cache_hits": 0, "coalesced": 0, "upstream": 0, "debounced": 0}
+
+
+class _TypingSession:
+    """One client's search-as-you-type state."""
+
+    def __init__(self):
+        self.seq = 0
+        self.query = ""
+        self.done_seq = 0
+        self.latest: Optional[dict] = None
+        self.next_result: Optional[asyncio.Future] = None
+
+    def complete(self, seq: int, result: Optional[dict]) -> None:
+        """
+        Record the outcome of search seq (None = failed or cancelled). When it is the
+        newest search, hand it to the superseded searches waiting for it; they run
+        their own search if it has no usable result.
+        """
+        if result is not None and seq > self.done_seq:
+            self.done_seq = seq
+            self.latest = result
+        if seq != self.seq:
+            return
+        waiter, self.next_result = self.next_result, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(result)
+
+
+_sessions: "OrderedDict[str, _TypingSession]" = OrderedDict()
+
+
+def _get_cache() -> Optional[TTLCache]:
+    global _search_cache
+    if _search_cache is None and ARTIC_SEARCH_CACHE_TTL > 0:
+        _search_cache = TTLCache(ttl_seconds=ARTIC_SEARCH_CACHE_TTL)
+    return _search_cache
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case and collapse whitespace."""
+    return " ".join(query.lower().split())
+
+
+def _cache_key(query: str, page: int, limit: int) -> str:
+    return f"search:{query}:{page}:{limit}"
+
+
+def _related(a: str, b: str) -> bool:
+    """Whether one query is the other one typed further (or backspaced)."""
+    return a.startswith(b) or b.startswith(a)
+
+
+def _session(client: str, limit: int) -> _TypingSession:
+    key = f"{client}:{limit}"
+    session = _sessions.pop(key, None) or _TypingSession()
+    _sessions[key] = session
+    if len(_sessions) > _MAX_SESSIONS:
+        _sessions.popitem(last=False)
+    return session
+
+
+async def _search_upstream(query: str, page: int, limit: int) -> dict:
+    _counters["upstream"] += 1
+    items, total = await search_artworks(query, page=page, limit=limit)
+    result = {"query": query, "items": items, "total": total}
+    cache = _get_cache()
+    if cache:
+        cache.set(_cache_key(query, page, limit), result)
+    return result
+
+
+async def _search(query: str, page: int, limit: int) -> dict:
+    """Cached or coalesced upstream search for exactly this query."""
+    key = _cache_key(query, page, limit)
+    cache = _get_cache()
+    if cache:
+        cached = cache.get(key)
+        if cached is not None:
+            _counters["cache_hits"] += 1
+            return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_search_upstream(query, page, limit))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        _counters["coalesced"] += 1
+    # Shield so one client disconnecting does not cancel the search for the others.
+    return await asyncio.shield(task)
+
+
+async def search(query: str, page: int = 1, limit: int = 20, client: Optional[str] = None) -> dict:
+    """
+    Search artworks. Returns ``{"query": str, "items": [...], "total": int}``,
+    where query is the normalized query the results are for: a debounced search
+    gets the results of the client's newer, related query.
+    Raises HTTPException(502) when an upstream request is needed and fails.
+    """
+    query = normalize_query(query)
+    cache = _get_cache()
+    if client is None or page != 1 or ARTIC_SEARCH_DEBOUNCE <= 0:
+        return await _search(query, page, limit)
+
+    session = _session(client, limit)
+    session.seq += 1
+    seq = session.seq
+    session.query = query
+    result = None
+    try:
+        if not (cache and cache.get(_cache_key(query, page, limit)) is not None):
+            await asyncio.sleep(ARTIC_SEARCH_DEBOUNCE)
+            if session.seq != seq and _related(session.query, query):
+                _counters["debounced"] += 1
+                if session.done_seq > seq and _related(session.latest["query"], query):
+                    return session.latest
+                if session.next_result is None:
+                    session.next_result = asyncio.get_running_loop().create_future()
+                newer = await asyncio.shield(session.next_result)
+                if newer is not None and _related(newer["query"], query):
+                    return newer
+                # The newer search failed or changed course: answer this one on its own.
+        result = await _search(query, page, limit)
+        return result
+    finally:
+        session.complete(seq, result)
+
+
+def stats() -> dict:
+    return {"in_flight": len(_inflight), "typing_sessions": len(_sessions), **_counters}
@@ -0,0 +1,95 @@
+"""
+Local artwork metadata store.
+
+Artwork metadata is fetched from the Art Institute API once per artwork and kept
+in the shared ``artworks`` table (one row per external_id), so project reads can
+return artist, image and gallery data without upstream calls.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List
+
+from fastapi import HTTPException, status
+from sqlalchemy import or_
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from config import ARTWORK_REFRESH_MAX_AGE
+from models import Artwork, ProjectPlace
+from services.artic import fetch_artworks
+
+
+def store_artworks(db: Session, records: dict[str, dict]) -> None:
+    """Insert or update artworks by external_id. The caller commits."""
+    if not records:
+        return
+    now = datetime.now(timezone.utc)
+    rows = [{"external_id": eid, **record, "fetched_at": now} for eid, record in records.items()]
+    stmt = insert(Artwork).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Artwork.external_id],
+        set_={
+            col: stmt.excluded[col]
+            for col in ("title", "artist_display", "date_display", "image_id", "gallery_title", "fetched_at")
+        },
+    )
+    db.execute(stmt)
+
+
+def get_artworks(db: Session, external_ids: Iterable[str]) -> dict[str, Artwork]:
+    """Locally stored artworks for the given IDs (no upstream calls)."""
+    ids = list(external_ids)
+    if not ids:
+        return {}
+    return {a.external_id: a for a in db.query(Artwork).filter(Artwork.external_id.in_(ids))}
+
+
+async def ensure_artworks(db: Session, external_ids: List[str]) -> dict[str, Artwork]:
+    """
+    Return artworks for the given IDs, fetching any not known locally with one
+    batch request and storing them.
+    Raises HTTPException(400) for IDs the Art Institute API does not know.
+    """
+    known = get_artworks(db, external_ids)
+    missing = list(dict.fromkeys(eid for eid in external_ids if eid not in known))
+    # Art Institute IDs are numeric; anything else cannot exist, so don't send it upstream.
+    numeric = [eid for eid in missing if eid.isdigit()]
+    fetched = await fetch_artworks(numeric) if numeric else {}
+    unknown = [eid for eid in missing if eid not in fetched]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Artwork with id {unknown[0]} does not exist in Art Institute API",
+        )
+    if fetched:
+        store_artworks(db, fetched)
+        known.update(get_artworks(db, fetched))
+    return known
+
+
+async def refresh_artworks(db: Session, max_age_seconds: int = ARTWORK_REFRESH_MAX_AGE, batch_size: int = 50) -> int:
+    """
+    Re-pull metadata for stale artworks and for place IDs with no stored artwork.
+    Commits per batch. Returns the number of artworks refreshed.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+    stale = {
+        eid
+        for (eid,) in db.query(Artwork.external_id).filter(
+            or_(Artwork.fetched_at.is_(None), Artwork.fetched_at < cutoff)
+        )
+    }
+    unknown = {
+        eid
+        for (eid,) in db.query(ProjectPlace.external_id)
+        .outerjoin(Artwork, Artwork.external_id == ProjectPlace.external_id)
+        .filter(Artwork.id.is_(None))
+        .distinct()
+    }
+    ids = sorted(stale | unknown)
+    refreshed = 0
+    for start in range(0, len(ids), batch_size):
+        records = await fetch_artworks(ids[start : start + batch_size])
+        store_artworks(db, records)
+        db.commit()
+        refreshed += len(records)
+    return refreshed
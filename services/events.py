@@ -0,0 +1,103 @@
+"""
+In-process change event bus (feeds the SSE change feed).
+
+Mutation paths publish compact events after committing. Events get increasing
+IDs and are kept in a bounded in-memory log so clients can resume with
+Last-Event-ID. Subscribers on the event loop all wait on one shared asyncio
+event, so idle connections cost no polling and no per-connection queues.
+"""
+import asyncio
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from config import EVENT_LOG_SIZE
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    id: int
+    type: str
+    project_id: int
+    data: dict = field(default_factory=dict)
+
+
+class EventBus:
+    """Thread-safe publisher; subscribers wait on the (single) server event loop."""
+
+    def __init__(self, max_events: int):
+        self._log: deque[ChangeEvent] = deque(maxlen=max(1, max_events))
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self.subscribers = 0
+
+    def publish(self, type: str, project_id: int, **data) -> ChangeEvent:
+        """Append an event to the log and wake subscribers. Safe from any thread."""
+        with self._lock:
+            self._last_id += 1
+            event = ChangeEvent(id=self._last_id, type=type, project_id=project_id, data=data)
+            self._log.append(event)
+            loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._notify)
+            except RuntimeError:
+                pass
+        return event
+
+    def _notify(self) -> None:
+        # Wake everyone waiting on the current event, then arm a fresh one.
+        if self._changed is not None:
+            self._changed.set()
+        self._changed = asyncio.Event()
+
+    def since(
+        self, last_id: int, project_id: Optional[int] = None
+    ) -> tuple[List[ChangeEvent], bool, int]:
+        """
+        Events after last_id (optionally for one project), oldest first.
+        Also returns whether events after last_id were already dropped from the
+        log, and the newest event ID seen (the cursor to pass to wait()).
+        """
+        with self._lock:
+            head = self._last_id
+            first_id = self._log[0].id if self._log else head + 1
+            # IDs in the log are contiguous, so skip straight to the first newer one.
+            start = max(0, last_id - first_id + 1)
+            events = list(itertools.islice(self._log, start, None))
+        # Also a gap if the client saw IDs from before a restart.
+        missed = last_id < first_id - 1 or last_id > head
+        matching = [e for e in events if project_id is None or e.project_id == project_id]
+        return matching, missed, head
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    async def wait(self, after_id: int, timeout: float) -> None:
+        """Wait until an event newer than after_id is published or timeout passes."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._changed = asyncio.Event()
+        changed = self._changed
+        if self._last_id > after_id:
+            return
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": self.subscribers,
+            "last_event_id": self._last_id,
+            "log_size": len(self._log),
+        }
+
+
+event_bus = EventBus(max_events=EVENT_LOG_SIZE)
@@ -0,0 +1,41 @@
+"""
+Startup timings and readiness checks.
+"""
+from sqlalchemy import text
+
+from services.artic import breaker
+
+# Filled in by main.py (module import) and the app lifespan (startup work).
+startup_stats: dict = {
+    "import_seconds": None,
+    "init_db_seconds": None,
+    "startup_seconds": None,
+    "started": False,
+}
+
+
+def check_database() -> dict:
+    from database import engine
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception as exc:
+        return {"ok": False, "error": str(exc)}
+    return {"ok": True}
+
+
+def readiness() -> tuple[bool, dict]:
+    """
+    Ready when startup finished and the database answers. An open Art Institute
+    circuit breaker is reported but does not fail readiness: reads still work.
+    """
+    database = check_database()
+    artic = breaker.state()
+    ready = startup_stats["started"] and database["ok"]
+    return ready, {
+        "status": "ready" if ready else "not ready",
+        "database": database,
+        "artic": artic,
+        "degraded": artic["state"] == "open",
+    }
@@ -0,0 +1,200 @@
+"""
+Idempotency-Key support for create endpoints.
+
+The first successful response for a key is stored (bounded in-memory TTL cache
+in front of the idempotency_keys table) and replayed for retries without
+running the handler again. Before the handler runs, the key is claimed with a
+pending row (status_code 0) in idempotency_keys, so concurrent requests with the
+same key wait for the first one even when they hit different worker processes.
+Failed requests release the claim, so they can be retried.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from sqlalchemy.dialects.sqlite import insert
+
+from config import IDEMPOTENCY_LOCK_TIMEOUT, IDEMPOTENCY_MAX_KEYS, IDEMPOTENCY_TTL
+from database import SessionLocal
+from models import IdempotencyKey
+from services.cache import TTLCache
+
+_memory = TTLCache(ttl_seconds=IDEMPOTENCY_TTL, max_size=IDEMPOTENCY_MAX_KEYS)
+_inflight: dict[str, asyncio.Future] = {}
+
+logger = logging.getLogger(__name__)
+
+# status_code of a claimed key whose request is still running.
+_PENDING = 0
+# How often a request polls for the response of a claim held by another process.
+_POLL_INTERVAL = 0.1
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _fingerprint(payload: BaseModel) -> str:
+    return hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def _load(store_key: str) -> Optional[dict]:
+    """Stored response or live claim for the key (claims have status_code _PENDING)."""
+    stored = _memory.get(store_key)
+    if stored is not None:
+        return stored
+    db = SessionLocal()
+    try:
+        row = db.get(IdempotencyKey, store_key)
+        if row is None or row.expires_at <= _utcnow():
+            return None
+        stored = {
+            "fingerprint": row.fingerprint,
+            "status_code": row.status_code,
+            "body": json.loads(row.response_body) if row.status_code != _PENDING else None,
+        }
+    finally:
+        db.close()
+    if stored["status_code"] != _PENDING:
+        _memory.set(store_key, stored)
+    return stored
+
+
+def _claim(store_key: str, fingerprint: str) -> bool:
+    """Insert a pending row for the key unless one exists. Returns True if claimed."""
+    now = _utcnow()
+    db = SessionLocal()
+    try:
+        # Also drops claims left behind by requests that died before finishing.
+        db.query(IdempotencyKey).filter(IdempotencyKey.expires_at <= now).delete(
+            synchronize_session=False
+        )
+        result = db.execute(
+            insert(IdempotencyKey)
+            .values(
+                key=store_key,
+                fingerprint=fingerprint,
+                status_code=_PENDING,
+                response_body="",
+                created_at=now,
+                expires_at=now + timedelta(seconds=IDEMPOTENCY_LOCK_TIMEOUT),
+            )
+            .on_conflict_do_nothing(index_elements=[IdempotencyKey.key])
+        )
+        db.commit()
+        return result.rowcount == 1
+    finally:
+        db.close()
+
+
+def _release(store_key: str) -> None:
+    """Drop our claim after a failed request so the key can be retried."""
+    db = SessionLocal()
+    try:
+        db.query(IdempotencyKey).filter(
+            IdempotencyKey.key == store_key, IdempotencyKey.status_code == _PENDING
+        ).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _save(store_key: str, stored: dict) -> None:
+    _memory.set(store_key, stored)
+    now = _utcnow()
+    db = SessionLocal()
+    try:
+        db.merge(
+            IdempotencyKey(
+                key=store_key,
+                fingerprint=stored["fingerprint"],
+                status_code=stored["status_code"],
+                response_body=json.dumps(stored["body"]),
+                created_at=now,
+                expires_at=now + timedelta(seconds=IDEMPOTENCY_TTL),
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _replay(stored: dict, fingerprint: str) -> JSONResponse:
+    if stored["fingerprint"] != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Idempotency-Key was already used with a different request body",
+        )
+    return JSONResponse(
+        content=stored["body"],
+        status_code=stored["status_code"],
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+async def run_idempotent(
+    key: Optional[str],
+    scope: str,
+    payload: BaseModel,
+    handler: Callable[[], Awaitable[Any]],
+    status_code: int,
+) -> Any:
+    """
+    Run handler once per (scope, key). Without a key, just runs handler.
+    Replays return a JSONResponse with the stored status and body.
+    Raises HTTPException(422) if the key is reused with a different payload.
+    """
+    if not key:
+        return await handler()
+    store_key = f"{scope}:{key}"
+    fingerprint = _fingerprint(payload)
+
+    while True:
+        pending = _inflight.get(store_key)
+        if pending is not None:
+            # Same process: wait without polling the database.
+            await asyncio.shield(pending)
+            continue
+        stored = _load(store_key)
+        if stored is None:
+            if _claim(store_key, fingerprint):
+                break
+        elif stored["status_code"] != _PENDING or stored["fingerprint"] != fingerprint:
+            return _replay(stored, fingerprint)
+        # Claimed by another process: wait for its response (or for the claim to go away).
+        await asyncio.sleep(_POLL_INTERVAL)
+
+    done = asyncio.get_running_loop().create_future()
+    _inflight[store_key] = done
+    try:
+        try:
+            result = await handler()
+        except BaseException:
+            try:
+                _release(store_key)
+            except Exception:
+                logger.exception("Could not release Idempotency-Key claim for %s", store_key)
+            raise
+        stored = {
+            "fingerprint": fingerprint,
+            "status_code": status_code,
+            "body": jsonable_encoder(result),
+        }
+        try:
+            _save(store_key, stored)
+        except Exception:
+            # The handler already committed: answer normally instead of inviting a
+            # retry that would write again. The response stays replayable from memory.
+            logger.exception("Could not persist Idempotency-Key response for %s", store_key)
+        return result
+    finally:
+        del _inflight[store_key]
+        done.set_result(None)
@@ -0,0 +1,253 @@
+"""
+Write-behind resolution of artwork titles.
+
+Places created with ARTIC_ASYNC_TITLES enabled are stored with a pending title.
+Their IDs are queued here; a background worker resolves them in batches (one
+Art Institute request per batch, with retries) and writes the titles back.
+The queue is in memory, so every place records when a process took it
+(title_claimed_at). Pending places whose claim is older than TITLE_CLAIM_TIMEOUT
+(their process died) are claimed atomically and queued again, at startup and by
+periodically by every worker, so each one is picked up by exactly one process.
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from config import (
+    TITLE_CLAIM_TIMEOUT,
+    TITLE_RESOLVER_BATCH_SIZE,
+    TITLE_RESOLVER_MAX_RETRIES,
+    TITLE_RESOLVER_RETRY_BACKOFF,
+)
+from database import SessionLocal
+from models import ProjectPlace
+from models.project_place import (
+    TITLE_STATUS_FAILED,
+    TITLE_STATUS_INVALID,
+    TITLE_STATUS_PENDING,
+    TITLE_STATUS_RESOLVED,
+)
+from services import analytics
+from services.artic import fetch_artworks
+from services.artwork_store import get_artworks, store_artworks
+from services.events import event_bus
+
+logger = logging.getLogger(__name__)
+
+
+class TitleResolver:
+    """In-process queue of place IDs with a single background worker thread."""
+
+    def __init__(self, batch_size: int, max_retries: int, retry_backoff: float, sweep_interval: float):
+        self._batch_size = max(1, batch_size)
+        self._sweep_interval = max(1.0, sweep_interval)
+        self._max_retries = max(0, max_retries)
+        self._retry_backoff = retry_backoff
+        self._queue: "queue.Queue[int]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._counters = {"resolved": 0, "invalid": 0, "failed": 0, "batches": 0}
+
+    def enqueue(self, place_ids: Iterable[int]) -> None:
+        """Queue places for title resolution (starts the worker on first use)."""
+        self._ensure_started()
+        for place_id in place_ids:
+            self._queue.put(place_id)
+
+    def queue_depth(self) -> int:
+        """Places queued or currently being resolved."""
+        return self._queue.unfinished_tasks
+
+    def wait_for_drain(self, timeout: float | None = None) -> bool:
+        """Block until every queued place is processed. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"queue_depth": self.queue_depth(), **self._counters}
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="title-resolver", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        next_sweep = time.monotonic() + self._sweep_interval
+        while True:
+            if time.monotonic() >= next_sweep:
+                self._sweep()
+                next_sweep = time.monotonic() + self._sweep_interval
+            try:
+                batch = [self._queue.get(timeout=max(0.0, next_sweep - time.monotonic()))]
+            except queue.Empty:
+                continue
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                asyncio.run(self._process(batch))
+            except Exception:
+                logger.exception("Title resolution batch failed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _sweep(self) -> None:
+        """Queue pending places abandoned by other (dead) processes."""
+        db = SessionLocal()
+        try:
+            for place_id in claim_pending_titles(db):
+                self._queue.put(place_id)
+        except Exception:
+            logger.exception("Sweeping for abandoned pending titles failed")
+        finally:
+            db.close()
+
+    async def _process(self, place_ids: List[int]) -> None:
+        db = SessionLocal()
+        try:
+            places = (
+                db.query(ProjectPlace)
+                .filter(
+                    ProjectPlace.id.in_(place_ids),
+                    ProjectPlace.title_status == TITLE_STATUS_PENDING,
+                )
+                .all()
+            )
+            if not places:
+                return
+            external_ids = sorted({p.external_id for p in places})
+            titles = {eid: a.title for eid, a in get_artworks(db, external_ids).items()}
+            missing = [eid for eid in external_ids if eid not in titles]
+            fetch_failed = False
+            if missing:
+                records = await self._fetch_with_retries(missing)
+                if records is None:
+                    fetch_failed = True
+                else:
+                    store_artworks(db, records)
+                    titles.update({eid: r.get("title") for eid, r in records.items()})
+
+            counts = {"resolved": 0, "invalid": 0, "failed": 0}
+            for place in places:
+                if place.external_id in titles:
+                    place.title = titles[place.external_id]
+                    place.title_status = TITLE_STATUS_RESOLVED
+                    counts["resolved"] += 1
+                elif fetch_failed:
+                    place.title_status = TITLE_STATUS_FAILED
+                    counts["failed"] += 1
+                else:
+                    place.title_status = TITLE_STATUS_INVALID
+                    analytics.record_place_invalid(db, place.external_id, place.visited)
+                    counts["invalid"] += 1
+            db.commit()
+            for place in places:
+                event_bus.publish("place.updated", place.project_id, place_id=place.id)
+            with self._lock:
+                self._counters["batches"] += 1
+                for key, value in counts.items():
+                    self._counters[key] += value
+        finally:
+            db.close()
+
+    async def _fetch_with_retries(self, external_ids: List[str]) -> Optional[dict]:
+        for attempt in range(self._max_retries + 1):
+            try:
+                return await fetch_artworks(external_ids)
+            except HTTPException as exc:
+                if attempt == self._max_retries:
+                    logger.warning("Giving up on titles for %s: %s", external_ids, exc.detail)
+                    return None
+                await asyncio.sleep(self._retry_backoff * (2 ** attempt))
+        return None
+
+
+title_resolver = TitleResolver(
+    batch_size=TITLE_RESOLVER_BATCH_SIZE,
+    max_retries=TITLE_RESOLVER_MAX_RETRIES,
+    retry_backoff=TITLE_RESOLVER_RETRY_BACKOFF,
+    sweep_interval=TITLE_CLAIM_TIMEOUT,
+)
+
+
+def claim_pending_titles(db: Session) -> List[int]:
+    """
+    Atomically take over pending places that no live process holds (never claimed,
+    or claimed more than TITLE_CLAIM_TIMEOUT ago). Returns their IDs; commits.
+    """
+    now = datetime.now(timezone.utc)
+    place_ids = list(
+        db.execute(
+            update(ProjectPlace)
+            .where(
+                ProjectPlace.title_status == TITLE_STATUS_PENDING,
+                or_(
+                    ProjectPlace.title_claimed_at.is_(None),
+                    ProjectPlace.title_claimed_at < now - timedelta(seconds=TITLE_CLAIM_TIMEOUT),
+                ),
+            )
+            .values(title_claimed_at=now)
+            .returning(ProjectPlace.id),
+            execution_options={"synchronize_session": False},
+        ).scalars()
+    )
+    db.commit()
+    return place_ids
+
+
+def backfill_missing_titles(db: Session) -> int:
+    """
+    Queue every place without a title (except ones already flagged invalid).
+    Returns the number of places queued.
+    """
+    place_ids = [
+        pid
+        for (pid,) in db.query(ProjectPlace.id).filter(
+            ProjectPlace.title.is_(None),
+            ProjectPlace.title_status != TITLE_STATUS_INVALID,
+        )
+    ]
+    if not place_ids:
+        return 0
+    db.query(ProjectPlace).filter(ProjectPlace.id.in_(place_ids)).update(
+        {
+            ProjectPlace.title_status: TITLE_STATUS_PENDING,
+            ProjectPlace.title_claimed_at: datetime.now(timezone.utc),
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+    title_resolver.enqueue(place_ids)
+    return len(place_ids)
+
+
+def requeue_pending_titles(db: Session) -> int:
+    """
+    Claim and queue places left pending by a previous process, and start the worker
+    (which keeps sweeping for abandoned places periodically). Called at app startup in every
+    worker process. Returns the number of places queued.
+    """
+    place_ids = claim_pending_titles(db)
+    title_resolver.enqueue(place_ids)
+    return len(place_ids)
@@ -0,0 +1,50 @@
+"""
+Shared fixtures: the app runs against a throwaway SQLite database and an
+unreachable Art Institute API (artworks are seeded into the local store).
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+_tmpdir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_tmpdir) / 'test.db'}"
+os.environ["ARTIC_BASE_URL"] = "http://127.0.0.1:9"
+os.environ["RATE_LIMIT_PER_SECOND"] = "0"
+os.environ.pop("BASIC_AUTH_USER", None)
+os.environ.pop("BASIC_AUTH_PASSWORD", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from database import SessionLocal
+from services.artwork_store import store_artworks
+
+
+@pytest.fixture(scope="session")
+def client():
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def artworks(db):
+    """Store artworks locally so adding them as places needs no upstream call."""
+
+    def seed(*external_ids: str) -> None:
+        store_artworks(db, {eid: {"title": f"Artwork {eid}"} for eid in external_ids})
+        db.commit()
+
+    return seed
@@ -0,0 +1,30 @@
+import asyncio
+
+from models import ProjectPlace
+from models.project_place import TITLE_STATUS_INVALID, TITLE_STATUS_PENDING
+from services import analytics, title_worker
+
+
+def test_invalid_artwork_ids_do_not_count_as_popular(client, db, monkeypatch):
+    project_id = client.post("/projects", json={"name": "Async"}).json()["id"]
+    # What add_place stores in async title mode.
+    place = ProjectPlace(project_id=project_id, external_id="999999", title_status=TITLE_STATUS_PENDING, visited=False)
+    db.add(place)
+    analytics.record_place_added(db, project_id, "999999")
+    db.commit()
+
+    async def no_such_artworks(external_ids):
+        return {}
+
+    monkeypatch.setattr(title_worker, "fetch_artworks", no_such_artworks)
+    asyncio.run(title_worker.title_resolver._process([place.id]))
+
+    db.refresh(place)
+    assert place.title_status == TITLE_STATUS_INVALID
+    popular = client.get("/stats/artworks/popular").json()["items"]
+    assert "999999" not in [item["external_id"] for item in popular]
+    assert analytics.verify(db) == []
+
+    # Deleting the project must not count the invalid place a second time.
+    assert client.delete(f"/projects/{project_id}").status_code == 204
+    assert analytics.verify(db) == []
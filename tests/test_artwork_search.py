@@ -0,0 +1,46 @@
+import asyncio
+
+from services import artwork_search
+
+
+def test_superseded_keystrokes_are_answered_by_the_newest_search(monkeypatch):
+    calls = []
+
+    async def fake_search_artworks(query, page=1, limit=20):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return [{"external_id": "1", "title": query}], 1
+
+    monkeypatch.setattr(artwork_search, "search_artworks", fake_search_artworks)
+
+    async def type_ahead():
+        searches = []
+        for query in ("hokus", "hokusa", "hokusai"):
+            searches.append(asyncio.ensure_future(artwork_search.search(query, client="typist")))
+            await asyncio.sleep(0.05)
+        return await asyncio.gather(*searches)
+
+    results = asyncio.run(type_ahead())
+
+    assert calls == ["hokusai"]
+    assert [r["query"] for r in results] == ["hokusai"] * 3
+
+
+def test_unrelated_queries_from_one_client_are_not_merged(monkeypatch):
+    calls = []
+
+    async def fake_search_artworks(query, page=1, limit=20):
+        calls.append(query)
+        return [], 0
+
+    monkeypatch.setattr(artwork_search, "search_artworks", fake_search_artworks)
+
+    async def two_searches():
+        first = asyncio.ensure_future(artwork_search.search("monet", client="office"))
+        await asyncio.sleep(0.05)
+        return await asyncio.gather(first, artwork_search.search("degas", client="office"))
+
+    results = asyncio.run(two_searches())
+
+    assert sorted(calls) == ["degas", "monet"]
+    assert [r["query"] for r in results] == ["monet", "degas"]
@@ -0,0 +1,29 @@
+from sqlalchemy import text
+
+
+def _backdate_project(db, project_id: int) -> None:
+    db.execute(
+        text("UPDATE projects SET updated_at = '2000-01-01 00:00:00' WHERE id = :id"), {"id": project_id}
+    )
+    db.execute(
+        text("UPDATE project_places SET updated_at = '2000-01-01 00:00:00' WHERE project_id = :id"),
+        {"id": project_id},
+    )
+    db.commit()
+
+
+def test_bulk_delete_updated_before_skips_projects_with_recent_place_activity(client, db, artworks):
+    artworks("1001", "1002")
+    active = client.post("/projects", json={"name": "Active", "place_ids": ["1001"]}).json()["id"]
+    idle = client.post("/projects", json={"name": "Idle", "place_ids": ["1002"]}).json()["id"]
+    _backdate_project(db, active)
+    _backdate_project(db, idle)
+
+    # Adding a place does not touch projects.updated_at.
+    assert client.post(f"/projects/{active}/places", json={"external_id": "1002"}).status_code == 201
+
+    response = client.delete("/projects", params={"ids": f"{active},{idle}", "updated_before": "2025-01-01"})
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 1}
+    assert client.get(f"/projects/{active}").status_code == 200
+    assert client.get(f"/projects/{idle}").status_code == 404
@@ -0,0 +1,18 @@
+from sqlalchemy import text
+
+from services.title_worker import claim_pending_titles
+
+
+def test_pending_titles_are_claimed_once(client, db, artworks):
+    artworks("2001", "2002")
+    project_id = client.post("/projects", json={"name": "Pending", "place_ids": ["2001", "2002"]}).json()["id"]
+    # As left behind by a process that died before resolving them.
+    db.execute(
+        text("UPDATE project_places SET title_status = 'pending', title_claimed_at = NULL WHERE project_id = :id"),
+        {"id": project_id},
+    )
+    db.commit()
+
+    claimed = claim_pending_titles(db)
+    assert len(claimed) == 2
+    assert claim_pending_titles(db) == []